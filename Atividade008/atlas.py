@@ -0,0 +1,139 @@
+import json
+import os
+import sys
+
+import pygame
+
+# Raiz do repositório no path: empacotamento e paleta são compartilhados
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.atlas import fingerprint, is_fresh, pack_shelves, to_palette  # noqa: E402
+
+# --- Atlas de Texturas do Mega Man X ---
+# Todos os quadros (já na escala do jogo) numa imagem só + um índice JSON.
+# Gerar de novo sempre que um PNG da pasta sprites mudar:
+#     python atlas.py
+# O índice guarda tamanho, mtime e hash de cada PNG; se algum mudou depois
+# do atlas, o jogo avisa e carrega os arquivos soltos.
+
+PASTA_SPRITES = "sprites"
+ARQUIVO_ATLAS = os.path.join(PASTA_SPRITES, "atlas.png")
+ARQUIVO_INDICE = os.path.join(PASTA_SPRITES, "atlas.json")
+
+MAGENTA = (255, 0, 255)  # cor de transparência dos sprites
+ESCALA = 4.5
+ESPACO = 1               # pixels entre quadros no atlas
+LARGURA_MAXIMA = 2048
+
+# nome da animação -> (prefixo do arquivo, quantidade de quadros)
+ANIMACOES = {
+    "parado": ("parado", 3),
+    "correndo": ("correndo", 11),
+    "pulando": ("pulando", 6),
+    "parado_atirando": ("atirando", 2),
+    "correndo_atirando": ("atirando_m", 11),
+}
+
+
+def carregar_quadro(arquivo, escala):
+    """ Lê um PNG da pasta sprites, aplica a transparência e escala. """
+    imagem = pygame.image.load(os.path.join(PASTA_SPRITES, arquivo)).convert()
+    imagem.set_colorkey(MAGENTA)
+    nova_largura = int(imagem.get_width() * escala)
+    nova_altura = int(imagem.get_height() * escala)
+    return pygame.transform.scale(imagem, (nova_largura, nova_altura))
+
+
+def arquivos_existentes(avisar=True):
+    """ {animação: [arquivos]} dos PNGs da tabela ANIMACOES que existem. """
+    arquivos = {}
+    for nome, (prefixo, quantidade) in ANIMACOES.items():
+        arquivos[nome] = []
+        for i in range(1, quantidade + 1):
+            arquivo = f"{prefixo}{i}.png"
+            if not os.path.exists(os.path.join(PASTA_SPRITES, arquivo)):
+                if avisar:
+                    print(f"AVISO: sprite '{arquivo}' não encontrado, quadro ignorado.")
+                continue
+            arquivos[nome].append(arquivo)
+    return arquivos
+
+
+def carregar_arquivos(escala, arquivos=None):
+    """ Carrega as animações arquivo por arquivo (sem atlas). """
+    if arquivos is None:
+        arquivos = arquivos_existentes()
+    return {nome: [carregar_quadro(arquivo, escala) for arquivo in lista]
+            for nome, lista in arquivos.items()}
+
+
+def gerar_atlas(escala=ESCALA):
+    """ Passo de build: escala todos os quadros e grava atlas + índice. """
+    arquivos = arquivos_existentes()
+    animacoes = carregar_arquivos(escala, arquivos)
+    quadros = [(nome, q) for nome, lista in animacoes.items() for q in lista]
+    tamanhos = [q.get_size() for _, q in quadros]
+    posicoes, tamanho = pack_shelves(
+        tamanhos, max([LARGURA_MAXIMA] + [w for w, _ in tamanhos]), ESPACO)
+
+    atlas = pygame.Surface(tamanho)
+    atlas.fill(MAGENTA)
+    indice = {
+        "escala": escala,
+        "animacoes": {nome: [] for nome in animacoes},
+        "arquivos": {a: fingerprint(os.path.join(PASTA_SPRITES, a))
+                     for lista in arquivos.values() for a in lista},
+    }
+    for (nome, quadro), (x, y) in zip(quadros, posicoes):
+        atlas.blit(quadro, (x, y))
+        indice["animacoes"][nome].append([x, y, quadro.get_width(), quadro.get_height()])
+
+    # Pixel art usa poucas cores: com paleta de 8 bits o PNG fica pequeno e
+    # decodifica rápido mesmo com os quadros já escalados. O magenta entra
+    # na paleta como cor comum; o colorkey é aplicado no carregamento.
+    atlas, _ = to_palette(atlas)
+
+    pygame.image.save(atlas, ARQUIVO_ATLAS)
+    with open(ARQUIVO_INDICE, "w") as f:
+        json.dump(indice, f, separators=(",", ":"))
+    print(f"Atlas {tamanho[0]}x{tamanho[1]} com {len(quadros)} quadros -> {ARQUIVO_ATLAS}")
+
+
+def carregar_atlas(escala):
+    """ Lê o atlas uma vez e devolve {animação: [subsurfaces]}, ou None se
+    ele não existe, foi gerado com outra escala ou algum PNG mudou. """
+    if not (os.path.exists(ARQUIVO_ATLAS) and os.path.exists(ARQUIVO_INDICE)):
+        return None
+    with open(ARQUIVO_INDICE) as f:
+        indice = json.load(f)
+    if indice["escala"] != escala:
+        return None
+
+    registrados = indice.get("arquivos", {})
+    arquivos = [a for lista in arquivos_existentes(avisar=False).values() for a in lista]
+    if set(arquivos) != set(registrados) or not all(
+            is_fresh(os.path.join(PASTA_SPRITES, a), registrados[a]) for a in arquivos):
+        print("AVISO: atlas desatualizado, carregando os PNGs soltos "
+              "(rode python atlas.py).")
+        return None
+
+    atlas = pygame.image.load(ARQUIVO_ATLAS).convert()
+    atlas.set_colorkey(MAGENTA)  # as subsurfaces herdam a transparência
+    return {nome: [atlas.subsurface(r) for r in rects]
+            for nome, rects in indice["animacoes"].items()}
+
+
+def carregar_animacoes(escala=ESCALA):
+    """ Animações do jogador: do atlas se houver, senão dos PNGs soltos. """
+    animacoes = carregar_atlas(escala)
+    if animacoes is None:
+        animacoes = carregar_arquivos(escala)
+    return animacoes
+
+
+if __name__ == "__main__":
+    # convert() precisa de uma janela; no build ela nem aparece
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    gerar_atlas(float(sys.argv[1]) if len(sys.argv) > 1 else ESCALA)
+    pygame.quit()
@@ -1,5 +1,6 @@
 import pygame
-import os
+
+from atlas import carregar_animacoes
 
 # --- 1. Inicialização e Configurações da Tela ---
 pygame.init()
@@ -11,14 +12,25 @@ pygame.display.set_caption("Meu Mega Man X")
 
 # Cor de fundo
 PRETO = (0, 0, 0)
-# Cor Rosa (para transparência, baseado nas suas imagens)
-MAGENTA = (255, 0, 255)
 
 # Controle de FPS (Frames Por Segundo)
 clock = pygame.time.Clock()
 FPS = 60
 
-# --- 2. Classe do Jogador (Mega Man X) ---
+# --- 2. Lista de Animação com Quadros Espelhados ---
+class Animacao(list):
+    """ Lista de quadros que guarda também as versões espelhadas (geradas uma vez). """
+    def __init__(self, quadros):
+        super().__init__(quadros)
+        self.espelhada = [pygame.transform.flip(q, True, False) for q in quadros]
+
+    def quadro(self, indice, olhando_direita=True):
+        """ Devolve o quadro já virado para o lado certo, sem criar Surface nova. """
+        if olhando_direita:
+            return self[indice]
+        return self.espelhada[indice]
+
+# --- 3. Classe do Jogador (Mega Man X) ---
 class Jogador(pygame.sprite.Sprite):
     def __init__(self):
         """ Método construtor - chamado uma vez quando o Jogador é criado. """
@@ -28,83 +40,16 @@ class Jogador(pygame.sprite.Sprite):
         self.escala = 4.5 
         
         # --- Carregamento dos Sprites ---
-        
-        self.anim_parado = []
-        for i in range(1, 4): # Carrega parado1.png, parado2.png, parado3.png
-            arquivo = f"parado{i}.png"
-            imagem = pygame.image.load(os.path.join("sprites", arquivo)).convert()
-            imagem.set_colorkey(MAGENTA)
-            
-            # --- Bloco de Escala ---
-            largura_original = imagem.get_width()
-            altura_original = imagem.get_height()
-            nova_largura = int(largura_original * self.escala)
-            nova_altura = int(altura_original * self.escala)
-            imagem_escalada = pygame.transform.scale(imagem, (nova_largura, nova_altura))
-            
-            self.anim_parado.append(imagem_escalada) 
-            
-        self.anim_correndo = []
-        for i in range(1, 12): # Carrega correndo1.png a correndo11.png
-            arquivo = f"correndo{i}.png"
-            imagem = pygame.image.load(os.path.join("sprites", arquivo)).convert()
-            imagem.set_colorkey(MAGENTA)
-            
-            # --- Bloco de Escala ---
-            largura_original = imagem.get_width()
-            altura_original = imagem.get_height()
-            nova_largura = int(largura_original * self.escala)
-            nova_altura = int(altura_original * self.escala)
-            imagem_escalada = pygame.transform.scale(imagem, (nova_largura, nova_altura))
-            
-            self.anim_correndo.append(imagem_escalada)
+        # Do atlas já escalado (gerado com "python atlas.py") ou, se ele não
+        # existir, PNG por PNG da pasta sprites
+        animacoes = carregar_animacoes(self.escala)
 
-        self.anim_pulando = []
-        for i in range(1, 7): # Carrega pulando1.png a pulando6.png
-            arquivo = f"pulando{i}.png"
-            imagem = pygame.image.load(os.path.join("sprites", arquivo)).convert()
-            imagem.set_colorkey(MAGENTA)
-            
-            # --- Bloco de Escala ---
-            largura_original = imagem.get_width()
-            altura_original = imagem.get_height()
-            nova_largura = int(largura_original * self.escala)
-            nova_altura = int(altura_original * self.escala)
-            imagem_escalada = pygame.transform.scale(imagem, (nova_largura, nova_altura))
-
-            self.anim_pulando.append(imagem_escalada)
-
-        # ### MUDANÇA: Carregando os 2 sprites de "Atirar Parado" ###
-        self.anim_parado_atirando = []
-        for i in range(1, 3): # Carrega atirando1.png, atirando2.png
-            arquivo = f"atirando{i}.png"
-            imagem = pygame.image.load(os.path.join("sprites", arquivo)).convert()
-            imagem.set_colorkey(MAGENTA)
-            
-            # --- Bloco de Escala ---
-            largura_original = imagem.get_width()
-            altura_original = imagem.get_height()
-            nova_largura = int(largura_original * self.escala)
-            nova_altura = int(altura_original * self.escala)
-            imagem_escalada = pygame.transform.scale(imagem, (nova_largura, nova_altura))
-            
-            self.anim_parado_atirando.append(imagem_escalada)
-        
-        # Carregando os 11 sprites de "Atirar Correndo"
-        self.anim_correndo_atirando = []
-        for i in range(1, 12): # Carrega atirando_m1.png a atirando_m11.png
-            arquivo = f"atirando_m{i}.png"
-            imagem = pygame.image.load(os.path.join("sprites", arquivo)).convert()
-            imagem.set_colorkey(MAGENTA)
-            
-            # --- Bloco de Escala ---
-            largura_original = imagem.get_width()
-            altura_original = imagem.get_height()
-            nova_largura = int(largura_original * self.escala)
-            nova_altura = int(altura_original * self.escala)
-            imagem_escalada = pygame.transform.scale(imagem, (nova_largura, nova_altura))
-            
-            self.anim_correndo_atirando.append(imagem_escalada)
+        # Espelha cada animação uma única vez (evita flip a cada frame)
+        self.anim_parado = Animacao(animacoes["parado"])
+        self.anim_correndo = Animacao(animacoes["correndo"])
+        self.anim_pulando = Animacao(animacoes["pulando"])
+        self.anim_parado_atirando = Animacao(animacoes["parado_atirando"])
+        self.anim_correndo_atirando = Animacao(animacoes["correndo_atirando"])
 
         # --- Variáveis de Estado e Animação ---
         self.frame_atual = 0 
@@ -187,13 +132,8 @@ class Jogador(pygame.sprite.Sprite):
             self.ultimo_update = agora
             self.frame_atual = (self.frame_atual + 1) % len(lista_animacao)
             
-            imagem_nova = lista_animacao[self.frame_atual]
             centro_antigo = self.rect.center
-            
-            if not self.olhando_direita:
-                imagem_nova = pygame.transform.flip(imagem_nova, True, False) 
-                
-            self.image = imagem_nova
+            self.image = lista_animacao.quadro(self.frame_atual, self.olhando_direita)
             self.rect = self.image.get_rect()
             self.rect.center = centro_antigo
 
@@ -204,16 +144,16 @@ class Jogador(pygame.sprite.Sprite):
             self.vel_y = self.forca_pulo
             self.pulando = True
 
-# --- 3. Criação dos Objetos (Antes do Loop) ---
+# --- 4. Criação dos Objetos (Antes do Loop) ---
 
 jogador = Jogador() 
 
-# --- 4. Loop Principal do Jogo ---
+# --- 5. Loop Principal do Jogo ---
 rodando = True
 while rodando:
     clock.tick(FPS) 
 
-    # --- 4a. Processamento de Eventos (Inputs) ---
+    # --- 5a. Processamento de Eventos (Inputs) ---
     for evento in pygame.event.get():
         if evento.type == pygame.QUIT:
             rodando = False
@@ -235,7 +175,7 @@ while rodando:
             if evento.key == pygame.K_w:
                 jogador.atirando = False # Para de atirar
 
-    # --- 4b. Checagem de Teclas (para movimento contínuo) ---
+    # --- 5b. Checagem de Teclas (para movimento contínuo) ---
     teclas = pygame.key.get_pressed()
     
     if teclas[pygame.K_LEFT]: # Seta Esquerda
@@ -250,13 +190,13 @@ while rodando:
         jogador.vel_x = 0
         jogador.correndo = False
 
-    # --- 4c. Atualização da Lógica ---
+    # --- 5c. Atualização da Lógica ---
     jogador.update() 
 
-    # --- 4d. Renderização (Desenho) - A ORDEM IMPORTA! ---
+    # --- 5d. Renderização (Desenho) - A ORDEM IMPORTA! ---
     tela.fill(PRETO)
     tela.blit(jogador.image, jogador.rect)
     pygame.display.flip()
 
-# --- 5. Finalização ---
+# --- 6. Finalização ---
 pygame.quit()
\ No newline at end of file
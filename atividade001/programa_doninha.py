@@ -1,8 +1,14 @@
 import random
 import string
 
+try:
+    import numpy as np
+except ImportError:  # the numpy engine is optional
+    np = None
+
 # defining the possible characters: lowercase letters, numbers and space
 POSSIBLE_CHARS = string.ascii_lowercase + string.digits + ' '
+DEFAULT_POPULATION_SIZE = 100
 
 
 def validate_input(phrase):
@@ -79,6 +85,128 @@ def select_best(population, target_phrase):
     return best_candidate, best_score
 
 
+def python_generations(initial_phrase, target_phrase, population_size):
+    """
+    runs the pure python engine until the target phrase is reached
+
+    args:
+        initial_phrase (str): phrase of the first generation
+        target_phrase (str): desired target phrase
+        population_size (int): size of each generated population
+
+    yields:
+        tuple: best phrase of each generation and its score
+    """
+    best_candidate = initial_phrase
+    while best_candidate != target_phrase:
+        population = reproduce(best_candidate, population_size)
+        best_candidate, best_score = select_best(population, target_phrase)
+        yield best_candidate, best_score
+
+
+def encode_phrase(phrase):
+    """
+    converts a phrase into a uint8 array of ascii codes
+
+    args:
+        phrase (str): phrase to be encoded
+
+    returns:
+        numpy.ndarray: one uint8 code per character
+    """
+    return np.frombuffer(phrase.encode('ascii'), dtype=np.uint8)
+
+
+def decode_phrase(codes):
+    """
+    converts a uint8 array of ascii codes back into a phrase
+
+    args:
+        codes (numpy.ndarray): encoded phrase
+
+    returns:
+        str: decoded phrase
+    """
+    return codes.tobytes().decode('ascii')
+
+
+def reproduce_numpy(best_codes, population_size=100, mutation_rate=0.05,
+                    rng=None, char_codes=None):
+    """
+    creates a (population_size, len) population from the best candidate,
+    mutating it with a single random mask draw
+
+    args:
+        best_codes (numpy.ndarray): encoded best phrase
+        population_size (int): size of the generated population
+        mutation_rate (float): mutation probability for each character
+        rng (numpy.random.Generator): random generator (optional)
+        char_codes (numpy.ndarray): encoded POSSIBLE_CHARS (optional)
+
+    returns:
+        numpy.ndarray: uint8 array, one mutated phrase per row
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if char_codes is None:
+        char_codes = encode_phrase(POSSIBLE_CHARS)
+    population = np.tile(best_codes, (population_size, 1))
+    mask = rng.random(population.shape, dtype=np.float32) < mutation_rate
+    population[mask] = char_codes[
+        rng.integers(0, len(char_codes), int(mask.sum()))
+    ]
+    return population
+
+
+def select_best_numpy(population, target_codes):
+    """
+    selects the best row of the population with one vectorized comparison
+    against the encoded target phrase
+
+    args:
+        population (numpy.ndarray): uint8 array, one phrase per row
+        target_codes (numpy.ndarray): encoded target phrase
+
+    returns:
+        tuple: best encoded phrase and its score
+    """
+    scores = (population == target_codes).sum(axis=1)
+    best = int(scores.argmax())
+    return population[best], int(scores[best])
+
+
+def numpy_generations(initial_phrase, target_phrase, population_size):
+    """
+    runs the vectorized numpy engine until the target phrase is reached.
+    the target and the charset are encoded once, and the best phrase
+    stays a uint8 row between generations (decoded only to be shown)
+
+    args:
+        initial_phrase (str): phrase of the first generation
+        target_phrase (str): desired target phrase
+        population_size (int): size of each generated population
+
+    yields:
+        tuple: best phrase of each generation and its score
+    """
+    rng = np.random.default_rng()
+    char_codes = encode_phrase(POSSIBLE_CHARS)
+    target_codes = encode_phrase(target_phrase)
+    best_codes = encode_phrase(initial_phrase)
+    best_score = int((best_codes == target_codes).sum())
+    while best_score < len(target_codes):
+        population = reproduce_numpy(best_codes, population_size,
+                                     rng=rng, char_codes=char_codes)
+        best_codes, best_score = select_best_numpy(population, target_codes)
+        yield decode_phrase(best_codes), best_score
+
+
+ENGINES = {
+    'python': python_generations,
+    'numpy': numpy_generations,
+}
+
+
 def main():
     """
     main function that runs the natural selection algorithm
@@ -106,13 +234,33 @@ def main():
             f"define an initial phrase with {len(target_phrase)} characters: "
         ).lower()
 
+    # user chooses the engine (numpy is faster for long phrases)
+    engine = input("choose the engine - python or numpy [python]: ").lower()
+    engine = engine.strip() or 'python'
+    while engine not in ENGINES or (engine == 'numpy' and np is None):
+        if engine == 'numpy':
+            print("numpy is not installed, use the python engine.")
+        else:
+            print(f"the engine must be one of: {', '.join(ENGINES)}.")
+        engine = input("choose the engine: ").lower().strip() or 'python'
+    run_engine = ENGINES[engine]
+
+    population_size = input(
+        f"define the population size [{DEFAULT_POPULATION_SIZE}]: "
+    ).strip()
+    while population_size and (not population_size.isdigit() or
+                               int(population_size) < 1):
+        print("the population size must be a positive integer.")
+        population_size = input("define the population size: ").strip()
+    population_size = int(population_size or DEFAULT_POPULATION_SIZE)
+
     best_candidate = initial_phrase
     generation = 0
 
-    # loop until the target phrase is reached
-    while best_candidate != target_phrase:
-        population = reproduce(best_candidate)
-        best_candidate, best_score = select_best(population, target_phrase)
+    # one step per generation until the target phrase is reached
+    for best_candidate, best_score in run_engine(
+        initial_phrase, target_phrase, population_size
+    ):
         accuracy = (best_score / len(target_phrase)) * 100
         print(
             f"generation {generation}: {best_candidate} - "
@@ -1,8 +1,16 @@
 # Jucimar Jr
 # 2024
 
-import pygame
 import math
+import sys
+from pathlib import Path
+
+import pygame
+
+# Repository root on the path, for the modules shared by the games
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from shared.text_cache import text_cache  # noqa: E402
+
 
 pygame.init()
 
@@ -17,7 +25,7 @@ pygame.display.set_caption("MyPong - PyGame Edition - 2024-09-02")
 
 # Score text
 score_font = pygame.font.Font('assets/PressStart2P.ttf', 44)
-score_text = score_font.render('00 x 00', True, COLOR_WHITE, COLOR_BLACK)
+score_text = text_cache.render(score_font, '00 x 00', COLOR_WHITE, COLOR_BLACK)
 score_text_rect = score_text.get_rect()
 score_text_rect.center = (680, 50)
 
@@ -197,8 +205,8 @@ while game_loop:
             player_2_y = 570
 
         # Update score HUD
-        score_text = score_font.render(
-            f"{score_1:02d} x {score_2:02d}", True, COLOR_WHITE, COLOR_BLACK
+        score_text = text_cache.render(
+            score_font, f"{score_1:02d} x {score_2:02d}", COLOR_WHITE, COLOR_BLACK
         )
 
         # Drawing objects
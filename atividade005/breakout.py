@@ -1,24 +1,32 @@
 # breakout - one block per paddle hit, blocks solid after break
 
 # First test comment of the break code
+import argparse
 import math
+import random
+import sys
+import time
 import pygame
 from pathlib import Path
 
-pygame.init()
-pygame.mixer.init()
+# Repository root on the path, for the modules shared by the games
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+from shared.text_cache import text_cache  # noqa: E402
 
 # SCREEN SETUP
 screen_size = (800, 800)
-screen = pygame.display.set_mode(screen_size)
-pygame.display.set_caption("Break Out")
+
+# TIMING
+# The game runs in fixed steps of step_dt seconds, whatever the frame rate
+tick_rate = 200  # simulation steps per second
+step_dt = 1 / tick_rate
+target_fps = 60  # frames drawn per second (python breakout.py --fps N)
+max_frame_time = 0.25  # a longer frame is clamped so the game doesn't spiral
 
 # PLAYER AND BALL SETUP
 ball_size = 15
-ball = pygame.Rect(400, 500, ball_size, ball_size)
-
 player_size = 100
-player = pygame.Rect(400, 750, player_size, 15)
+player_speed = 1000  # pixels per second
 
 blocks_per_line = 14
 lines_of_blocks = 8
@@ -44,37 +52,37 @@ points_per_color = {
 }
 
 # GAME VARIABLES
-end_game = False
-lives = 3
-score = 0
-speed_level_1 = 2.0
-speed_level_2 = 3.5
-speed_level_3 = 4.5
-speed_level_4 = 5.5
-
-# Flags to control if the speed has already been changed
-hit_green = False
-hit_orange = False
-hit_red = False
+start_lives = 3
 
-
-# Initial diagonal normalized ball direction
-ball_move = [speed_level_1 / (2**0.5), speed_level_1 / (2**0.5)]
-can_break_block = True  # Allow breaking 1 block after paddle hit
+# Ball speeds in pixels per second
+speed_level_1 = 400
+speed_level_2 = 700
+speed_level_3 = 900
+speed_level_4 = 1100
+speed_levels = (speed_level_1, speed_level_2, speed_level_3, speed_level_4)
 
 
 # BLOCKS
-def create_blocks(blocks_per_line, lines_of_blocks):
-    """Create blocks on the screen with defined spacing."""
+def block_layout(blocks_per_line):
+    """Block size and spacing for the given number of columns, scaled to
+    the screen."""
     width_size, height_size = screen_size
     block_distance = int(width_size * 0.008)  # reduce space between blocks
     block_width = width_size / blocks_per_line - block_distance
     block_height = int(height_size * 0.015)  # thinner height
     line_distance = block_height + int(height_size * 0.01)
+    offset_top = int(height_size * 0.1)
+    return block_width, block_height, block_distance, line_distance, offset_top
+
+
+def create_blocks(blocks_per_line, lines_of_blocks):
+    """Create blocks on the screen with defined spacing, one list per line."""
+    block_width, block_height, block_distance, line_distance, offset_top = \
+        block_layout(blocks_per_line)
 
     blocks = []
-    offset_top = int(height_size * 0.1)
     for j in range(lines_of_blocks):
+        line = []
         for i in range(blocks_per_line):
             block = pygame.Rect(
                 i * (block_width + block_distance),
@@ -82,257 +90,610 @@ def create_blocks(blocks_per_line, lines_of_blocks):
                 block_width,
                 block_height
             )
-            blocks.append(block)
+            line.append(block)
+        blocks.append(line)
     return blocks
 
 
+class BlockGrid:
+    """Blocks kept in their (line, column) cells; a broken block leaves None.
+
+    A rect only has to be tested against the few cells it overlaps, and
+    removing a block is a single assignment. The blocks are also painted
+    once into an off-screen layer, so drawing the field is one blit.
+    """
+
+    def __init__(self, blocks_per_line, lines_of_blocks, line_colors):
+        self.columns = blocks_per_line
+        self.lines = lines_of_blocks
+        block_width, _, block_distance, line_distance, offset_top = \
+            block_layout(blocks_per_line)
+        self.column_step = block_width + block_distance
+        self.line_step = line_distance
+        self.offset_top = offset_top
+        _, block_height, _, _, _ = block_layout(blocks_per_line)
+        last_line_top = offset_top + (lines_of_blocks - 1) * line_distance
+        self.bottom = last_line_top + block_height
+
+        self.cells = create_blocks(blocks_per_line, lines_of_blocks)
+        self.colors = [
+            [line_colors[j % len(line_colors)]] * blocks_per_line
+            for j in range(lines_of_blocks)
+        ]
+        self.count = blocks_per_line * lines_of_blocks
+        self.layer = None
+
+    def build_layer(self):
+        """Paint every block into a transparent layer covering the field
+        (clipped to the screen, rows below it are never visible)."""
+        height = max(1, min(self.bottom, screen_size[1]) - self.offset_top)
+        self.layer = pygame.Surface((screen_size[0], height))
+        if pygame.display.get_surface() is not None:
+            self.layer = self.layer.convert()
+        self.layer.fill(colors["black"])
+        self.layer.set_colorkey(colors["black"], pygame.RLEACCEL)
+        for block, color in self:
+            self.layer.fill(color, block.move(0, -self.offset_top))
+
+    def draw(self, surface):
+        if self.layer is None:
+            self.build_layer()
+        surface.blit(self.layer, (0, self.offset_top))
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Yield (block, color) for every block still standing."""
+        for line, colors_line in zip(self.cells, self.colors):
+            for block, color in zip(line, colors_line):
+                if block is not None:
+                    yield block, color
+
+    def cells_under(self, left, top, right, bottom):
+        """Line and column ranges of the cells the box can touch."""
+        # One extra cell on each side covers the int rounding of the rects
+        first_col = max(0, int(left // self.column_step) - 1)
+        last_col = min(self.columns - 1, int(right // self.column_step) + 1)
+        first_line = max(0, int((top - self.offset_top) // self.line_step) - 1)
+        last_line = min(self.lines - 1,
+                        int((bottom - self.offset_top) // self.line_step) + 1)
+        return range(first_line, last_line + 1), range(first_col, last_col + 1)
+
+    def remove(self, line, column):
+        block = self.cells[line][column]
+        self.cells[line][column] = None
+        self.count -= 1
+        if self.layer is not None:
+            self.layer.fill(colors["black"], block.move(0, -self.offset_top))
+
+
 # Colors per line
 line_colors = [
     colors["red"], colors["red"], colors["orange"], colors["orange"],
     colors["green"], colors["green"], colors["yellow"], colors["yellow"]
 ]
 
-# Create blocks and colors
-blocks = create_blocks(blocks_per_line, lines_of_blocks)
-block_colors = []
-for line in range(lines_of_blocks):
-    for _ in range(blocks_per_line):
-        block_colors.append(line_colors[line])
 
 # SOUNDS SETUP
 BASE = Path(__file__).resolve().parent  # script folder
 
 # Game sounds
-sound_blocks = pygame.mixer.Sound(str(BASE / "assets/breaksound.wav"))
-sound_collision = pygame.mixer.Sound(str(BASE / "assets/bounce.wav"))
-sound_loss = pygame.mixer.Sound(str(BASE / "assets/wrong-buzzer-6268.mp3"))
-
-
-# DRAWING FUNCTIONS
-def draw_start_screen():
-    """Draw ball and player on the start screen."""
-    screen.fill(colors["black"])
-    pygame.draw.rect(screen, colors["blue"], player)
-    pygame.draw.rect(screen, colors["white"], ball)
-
+sound_files = {
+    "blocks": "assets/breaksound.wav",
+    "collision": "assets/bounce.wav",
+    "loss": "assets/wrong-buzzer-6268.mp3",
+}
 
-def draw_blocks(blocks):
-    """Draw blocks on the screen with specific colors."""
-    for idx, block in enumerate(blocks):
-        pygame.draw.rect(screen, block_colors[idx], block)
 
+class SilentSound:
+    """Stand-in for a Sound when the game runs without a mixer."""
 
-def draw_end_screen(message):
-    """Draw end game screen with a message."""
-    screen.fill(colors["black"])
-    font = pygame.font.SysFont(None, 80)
-    text = font.render(message, True, colors["white"])
-    center_coords = (screen_size[0] // 2, screen_size[1] // 2)
-    text_rect = text.get_rect(center=center_coords)
-    screen.blit(text, text_rect)
-    pygame.display.flip()
-    pygame.time.wait(3000)
-
-
-def update_player_movement():
-    """Update player position based on keys."""
-    keys = pygame.key.get_pressed()
-    if keys[pygame.K_RIGHT] and (player.x + player_size) < screen_size[0]:
-        player.x += 5
-    if keys[pygame.K_LEFT] and player.x > 0:
-        player.x -= 5
-
-
-# BALL MOVEMENT
-def move_ball(ball, lives):
-    """Move the ball and update lives if necessary."""
-    global ball_move
-    movement = ball_move
-    ball.x += movement[0]
-    ball.y += movement[1]
-
-    # Wall collisions
-    if ball.x <= 0:
-        ball.x = 0
-        movement[0] = -movement[0]
-        sound_collision.play()
-    if ball.x + ball_size >= screen_size[0]:
-        ball.x = screen_size[0] - ball_size
-        movement[0] = -movement[0]
-        sound_collision.play()
-    if ball.y < 0:
-        ball.y = 0
-        movement[1] = -movement[1]
-        sound_collision.play()
-
-    # Lives system
-    if ball.y + ball_size >= screen_size[1]:
-        sound_loss.play()
-        lives -= 1
-        if lives > 0:
-            ball.x = screen_size[0] // 2
-            ball.y = screen_size[1] // 2
+    def play(self):
+        pass
 
-            # Keep speed according to previous hits
-            current_speed = speed_level_1
-            if hit_green:
-                current_speed = speed_level_2
-            if hit_orange:
-                current_speed = speed_level_3
-            if hit_red:
-                current_speed = speed_level_4
 
-            movement[0] = current_speed / math.sqrt(2)
-            movement[1] = -current_speed / math.sqrt(2)
-            return movement, lives
-        else:
-            return None, lives  # out of lives
-    return movement, lives
+def load_sounds():
+    """Load every game sound (the mixer must be initialized)."""
+    return {
+        name: pygame.mixer.Sound(str(BASE / path))
+        for name, path in sound_files.items()
+    }
 
 
-# (Don't forget to have 'import math' at the top of your file)
+# SWEPT COLLISION
+def sweep(box, move, target):
+    """Swept AABB test of box (x, y, w, h) travelling by move against the
+    target rect.
 
-# BALL COLLISION
-def ball_collision_player(ball, player):
-    """Check ball collision with player and adjust speed."""
-    global can_break_block, hit_green, hit_orange, hit_red
+    Returns (time, axis): time in [0, 1] is the fraction of the move at
+    first contact and axis is 0 for a vertical face, 1 for a horizontal
+    one. Returns None if they don't meet during this move (or already
+    overlap).
+    """
+    x, y, w, h = box
+    dx, dy = move
 
-    if ball.colliderect(player) and ball_move[1] > 0:
-        sound_collision.play()
+    if dx > 0:
+        entry_x, exit_x = (target.left - (x + w)) / dx, (target.right - x) / dx
+    elif dx < 0:
+        entry_x, exit_x = (target.right - x) / dx, (target.left - (x + w)) / dx
+    elif x + w <= target.left or x >= target.right:
+        return None
+    else:
+        entry_x, exit_x = -math.inf, math.inf
+
+    if dy > 0:
+        entry_y, exit_y = (target.top - (y + h)) / dy, (target.bottom - y) / dy
+    elif dy < 0:
+        entry_y, exit_y = (target.bottom - y) / dy, (target.top - (y + h)) / dy
+    elif y + h <= target.top or y >= target.bottom:
+        return None
+    else:
+        entry_y, exit_y = -math.inf, math.inf
+
+    entry = max(entry_x, entry_y)
+    if entry > min(exit_x, exit_y) or entry < 0 or entry > 1:
+        return None
+    return entry, (0 if entry_x > entry_y else 1)
+
+
+def wall_hit(box, move):
+    """Earliest (time, axis) the ball reaches the left, right or top wall."""
+    x, y, w, h = box
+    dx, dy = move
+    hits = []
+    if dx < 0 and x + dx < 0:
+        hits.append((-x / dx, 0))
+    if dx > 0 and x + w + dx > screen_size[0]:
+        hits.append(((screen_size[0] - w - x) / dx, 0))
+    if dy < 0 and y + dy < 0:
+        hits.append((-y / dy, 1))
+    return min(hits) if hits else None
+
+
+# GAME STATE
+class Breakout:
+    """One game of Breakout. step(inputs) advances it by one tick.
+
+    All the state lives in the instance, so several games can run side by
+    side, and nothing here needs a window or a mixer: without sounds every
+    sound is silent and the block layer is only painted when drawn.
+    """
+
+    def __init__(self, sounds=None, speeds=speed_levels):
+        self.ball = pygame.Rect(400, 500, ball_size, ball_size)
+        # Exact position, the ball rect is rounded from it
+        self.ball_pos = [float(self.ball.x), float(self.ball.y)]
+        self.player = pygame.Rect(400, 750, player_size, 15)
+        self.player_x = float(self.player.x)  # exact position, like the ball
+        self.blocks = BlockGrid(blocks_per_line, lines_of_blocks, line_colors)
+
+        self.lives = start_lives
+        self.score = 0
+        self.steps = 0
+        self.result = None  # "GAME OVER" or "YOU WIN!" once finished
+        # Ball speed for start, green, orange and red. Kept in pixels per
+        # step: at a fixed step every move is the same exact float as when
+        # speeds were per-iteration pixels, so headless games replay
+        self.speeds = tuple(speed / tick_rate for speed in speeds)
+
+        # Flags to control if the speed has already been changed
+        self.hit_green = False
+        self.hit_orange = False
+        self.hit_red = False
+
+        # Initial diagonal normalized ball direction (pixels per step)
+        speed = self.speeds[0]
+        self.ball_move = [speed / (2**0.5), speed / (2**0.5)]
+        self.can_break_block = True  # Allow breaking 1 block after paddle hit
+
+        sounds = sounds or {}
+        silent = SilentSound()
+        self.sound_blocks = sounds.get("blocks", silent)
+        self.sound_collision = sounds.get("collision", silent)
+        self.sound_loss = sounds.get("loss", silent)
+
+    @property
+    def finished(self):
+        return self.result is not None
+
+    def step(self, inputs=(), dt=step_dt):
+        """Advance the game by dt seconds. `inputs` holds the pressed
+        actions, any of "left" and "right"."""
+        if self.result is not None:
+            return
+        self.steps += 1
+        ticks = dt * tick_rate  # exactly 1.0 for step_dt
+        alive = self.move_ball(ticks)
+        self.update_player_movement(inputs, ticks)
+        if not alive:
+            self.result = "GAME OVER"
+            return
+
+        self.ball_collision_player()
+
+        # Win condition
+        if self.blocks.count == 0:
+            self.result = "YOU WIN!"
+
+    def update_player_movement(self, inputs, ticks):
+        """Update player position based on the pressed actions, moving for
+        `ticks` fixed steps."""
+        if not inputs:
+            return  # already inside the screen
+        move = player_speed / tick_rate * ticks
+        if "right" in inputs:
+            self.player_x += move
+        if "left" in inputs:
+            self.player_x -= move
+        right_edge = screen_size[0] - player_size
+        self.player_x = max(0.0, min(self.player_x, right_edge))
+        self.player.x = round(self.player_x)
+
+    def current_level_speed(self):
+        """Ball speed for the furthest block color reached so far."""
+        current_speed = self.speeds[0]
+        if self.hit_green:
+            current_speed = self.speeds[1]
+        if self.hit_orange:
+            current_speed = self.speeds[2]
+        if self.hit_red:
+            current_speed = self.speeds[3]
+        return current_speed
+
+    def hit_block(self, line, column):
+        """Ball touched a block: break it if a break is available. Blocks are
+        solid either way, the caller bounces the ball."""
+        # Only break one block per paddle hit
+        if not self.can_break_block:
+            return
+        self.can_break_block = False  # Already broke one block
+
+        # Points gained and speed update
+        block_color = self.blocks.colors[line][column]
+        target_speed = 0
+        if block_color == colors["red"] and not self.hit_red:
+            self.hit_red = True
+            self.hit_orange = True
+            self.hit_green = True
+            target_speed = self.speeds[3]
+        elif block_color == colors["orange"] and not self.hit_orange:
+            self.hit_orange = True
+            self.hit_green = True
+            target_speed = self.speeds[2]
+        elif block_color == colors["green"] and not self.hit_green:
+            self.hit_green = True
+            target_speed = self.speeds[1]
+
+        ball_move = self.ball_move
+        if target_speed > 0:
+            speed_current = math.sqrt(ball_move[0]**2 + ball_move[1]**2)
+            if speed_current > 0:
+                factor = target_speed / speed_current
+                ball_move[0] *= factor
+                ball_move[1] *= factor
+
+        self.score += points_per_color.get(block_color, 1)
+        self.sound_blocks.play()
+
+        # Remove broken block
+        self.blocks.remove(line, column)
+
+    def bounce_on_player(self):
+        """Set the exit angle from where the ball hit the paddle."""
+        self.sound_collision.play()
 
         # 1. Determine the target speed based on game progress
-        target_speed = speed_level_1
-        if hit_green:
-            target_speed = speed_level_2
-        if hit_orange:
-            target_speed = speed_level_3
-        if hit_red:
-            target_speed = speed_level_4
-
-        # --- NEW PRECISE RICOCHET LOGIC ---
+        target_speed = self.current_level_speed()
+
         # 2. Calculate the normalized impact point on the paddle
         # (-1.0 on the left edge, 0.0 in the center, 1.0 on the right edge)
-        impact_point = (ball.centerx - player.centerx) / (player.width / 2.0)
-
+        player = self.player
+        ball_centerx = self.ball_pos[0] + ball_size / 2
+        impact_point = (ball_centerx - player.centerx) / (player.width / 2.0)
         impact_point = max(-1.0, min(1.0, impact_point))
 
         max_bounce_angle = math.radians(75)
 
-        # 4. Calculate the new exit angle
+        # 3. Calculate the new exit angle
         bounce_angle = impact_point * max_bounce_angle
 
-        # 5. Calculate the new velocity components using trigonometry
-        ball_move[0] = target_speed * math.sin(bounce_angle)
-        ball_move[1] = -target_speed * math.cos(bounce_angle)
-
-        ball.bottom = player.top
+        # 4. Calculate the new velocity components using trigonometry
+        self.ball_move[0] = target_speed * math.sin(bounce_angle)
+        self.ball_move[1] = -target_speed * math.cos(bounce_angle)
 
         # Allow the next hit to break a block
-        can_break_block = True
-
-
-# MAIN LOOP
-while not end_game:
-    result = move_ball(ball, lives)
-    draw_start_screen()
-    draw_blocks(blocks)
-
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            end_game = True
-
-    update_player_movement()
-    if result[0] is None:
-        draw_end_screen("GAME OVER")
-        break
-    else:
-        ball_move, lives = result
+        self.can_break_block = True
+
+    # BALL MOVEMENT
+    def move_ball(self, ticks):
+        """Move the ball along ball_move for `ticks` fixed steps, bouncing
+        at the exact time of impact with walls, paddle and blocks, and
+        update lives if necessary. Returns False once the last life is
+        lost."""
+        ball, ball_pos, movement = self.ball, self.ball_pos, self.ball_move
+        blocks = self.blocks
+
+        remaining = ticks
+        for _ in range(8):  # bounces resolved within one step
+            box = (ball_pos[0], ball_pos[1], ball_size, ball_size)
+            move = (movement[0] * remaining, movement[1] * remaining)
+
+            # Earliest contact: walls, paddle (only from above), then the grid
+            # cells covered by the swept ball
+            hit = wall_hit(box, move)
+            target = "wall"
+            reach = box[1] + ball_size + move[1]
+            if movement[1] > 0 and reach >= self.player.top:
+                player_hit = sweep(box, move, self.player)
+                if player_hit is not None and (hit is None or player_hit[0] < hit[0]):
+                    hit, target = player_hit, "player"
+
+            # Most steps the ball is below the field and no cell is looked at
+            top = box[1] + move[1] if move[1] < 0 else box[1]
+            if top <= blocks.bottom:
+                if move[0] < 0:
+                    left, right = box[0] + move[0], box[0] + ball_size
+                else:
+                    left, right = box[0], box[0] + ball_size + move[0]
+                bottom = reach if move[1] > 0 else box[1] + ball_size
+                lines, columns = blocks.cells_under(left, top, right, bottom)
+                for line in lines:
+                    cells = blocks.cells[line]
+                    for column in columns:
+                        block = cells[column]
+                        if block is None:
+                            continue
+                        block_hit = sweep(box, move, block)
+                        if block_hit is None:
+                            continue
+                        if hit is None or block_hit[0] < hit[0]:
+                            hit, target = block_hit, (line, column)
+
+            if hit is None:
+                ball_pos[0] += move[0]
+                ball_pos[1] += move[1]
+                break
+
+            fraction, axis = hit
+            ball_pos[0] += move[0] * fraction
+            ball_pos[1] += move[1] * fraction
+            remaining *= 1 - fraction
+
+            if target == "player":
+                self.bounce_on_player()
+            else:
+                movement[axis] = -movement[axis]
+                if target == "wall":
+                    self.sound_collision.play()
+                else:
+                    self.hit_block(*target)
+
+        ball.x = round(ball_pos[0])
+        ball.y = round(ball_pos[1])
+
+        # Lives system
+        if ball.y + ball_size >= screen_size[1]:
+            self.sound_loss.play()
+            self.lives -= 1
+            if self.lives <= 0:
+                return False  # out of lives
+            ball_pos[0] = ball.x = screen_size[0] // 2
+            ball_pos[1] = ball.y = screen_size[1] // 2
 
-    ball_collision_player(ball, player)
+            # Keep speed according to previous hits
+            current_speed = self.current_level_speed()
 
-    # BLOCK COLLISION
-    collided_blocks = [
-        idx
-        for idx, block in enumerate(blocks)
-        if ball.colliderect(block)
-    ]
-    for idx in collided_blocks:
-        block = blocks[idx]
+            movement[0] = current_speed / math.sqrt(2)
+            movement[1] = -current_speed / math.sqrt(2)
+        return True
+
+    # BALL COLLISION
+    def ball_collision_player(self):
+        """Bounce the ball if the paddle moved into it (the swept test in
+        move_ball only sees the ball moving into a still paddle)."""
+        if self.ball.colliderect(self.player) and self.ball_move[1] > 0:
+            self.bounce_on_player()
+            self.ball.bottom = self.player.top
+            self.ball_pos[1] = float(self.ball.y)
+
+
+# AI PLAYER
+class AutoPlayer:
+    """Paddle that follows the ball, hitting it at a random point of the
+    paddle each time so the games differ."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.aim = 0.0
+        self.falling = False
+
+    def inputs(self, game):
+        falling = game.ball_move[1] > 0
+        if falling and not self.falling:
+            self.aim = self.rng.uniform(-0.4, 0.4) * player_size
+        self.falling = falling
+
+        target = game.ball_pos[0] + ball_size / 2 - self.aim
+        reach = player_speed / tick_rate
+        if target > game.player.centerx + reach:
+            return ("right",)
+        if target < game.player.centerx - reach:
+            return ("left",)
+        return ()
+
+
+def simulate(games, seed=0, max_steps=500000, speeds=speed_levels):
+    """Play `games` headless games with AutoPlayer and print a summary.
+
+    A normal game clears the field in about 40k-60k steps. Games still
+    running after max_steps are counted as cut off, apart from wins and
+    losses, and left out of the averages.
+    """
+    rng = random.Random(seed)
+    finished = {"YOU WIN!": 0, "GAME OVER": 0}
+    scores = []
+    steps = []
+    cut_off = 0
+    start = time.perf_counter()
+    for _ in range(games):
+        game = Breakout(speeds=speeds)
+        ai = AutoPlayer(rng)
+        while not game.finished and game.steps < max_steps:
+            game.step(ai.inputs(game))
+        if not game.finished:
+            cut_off += 1
+            continue
+        finished[game.result] += 1
+        scores.append(game.score)
+        steps.append(game.steps)
+    elapsed = time.perf_counter() - start
+
+    print(f"{games} games in {elapsed:.1f} s "
+          f"({games / elapsed * 60:.0f} per minute)")
+    print(f"wins {finished['YOU WIN!']} | losses {finished['GAME OVER']} | "
+          f"cut off at {max_steps} steps {cut_off}")
+    if scores:
+        print(f"finished games: avg score {sum(scores) / len(scores):.1f} | "
+              f"avg steps {sum(steps) / len(steps):.0f}")
 
-        # Only break one block per paddle hit
-        if can_break_block:
-            can_break_block = False  # Already broke one block
-            # Points gained and speed update
-            block_color = block_colors[idx]
-            target_speed = 0
-            if block_color == colors["red"] and not hit_red:
-                hit_red = True
-                hit_orange = True
-                hit_green = True
-                target_speed = speed_level_4
-            elif block_color == colors["orange"] and not hit_orange:
-                hit_orange = True
-                hit_green = True
-                target_speed = speed_level_3
-            elif block_color == colors["green"] and not hit_green:
-                hit_green = True
-                target_speed = speed_level_2
-
-            if target_speed > 0:
-                speed_current = math.sqrt(ball_move[0]**2 + ball_move[1]**2)
-                if speed_current > 0:
-                    factor = target_speed / speed_current
-                    ball_move[0] *= factor
-                    ball_move[1] *= factor
-
-            score += points_per_color.get(block_color, 1)
-            sound_blocks.play()
-
-            # Remove broken block
-            blocks.pop(idx)
-            block_colors.pop(idx)
-
-        # Treat remaining blocks as solid
-        overlap_x = min(ball.right - block.left, block.right - ball.left)
-        overlap_y = min(ball.bottom - block.top, block.bottom - ball.top)
-        if overlap_x < overlap_y:
-            if ball.centerx < block.centerx:
-                ball.right = block.left
-            else:
-                ball.left = block.right
-            ball_move[0] = -ball_move[0]
-        else:
-            if ball.centery < block.centery:
-                ball.bottom = block.top
-            else:
-                ball.top = block.bottom
-            ball_move[1] = -ball_move[1]
 
-    # Win condition
-    if len(blocks) == 0:
-        draw_end_screen("YOU WIN!")
-        break
+# DRAWING FUNCTIONS
+def draw_game(screen, game, font):
+    """Draw ball, player, blocks and HUD."""
+    screen.fill(colors["black"])
+    pygame.draw.rect(screen, colors["blue"], game.player)
+    pygame.draw.rect(screen, colors["white"], game.ball)
+    game.blocks.draw(screen)
 
     # HUD
-    font_size = int(screen_size[1] * 0.05)
-    font = pygame.font.SysFont(None, font_size)
     y_pos_top = 10
 
     # Formatted score
-    formatted_score = f"{score:03d}"
-    score_text = font.render(formatted_score, True, colors["white"])
+    formatted_score = f"{game.score:03d}"
+    score_text = text_cache.render(font, formatted_score, colors["white"])
     x_pos_score = screen_size[0] // 2 + 100
     screen.blit(score_text, (x_pos_score, y_pos_top))
 
     # Remaining lives
-    lives_text = font.render(f"{lives}", True, colors["white"])
+    lives_text = text_cache.render(font, f"{game.lives}", colors["white"])
     screen.blit(lives_text, (30, y_pos_top))
 
     # Central divider
-    player_label = font.render("||", True, colors["white"])
+    player_label = text_cache.render(font, "||", colors["white"])
     screen.blit(player_label, (screen_size[0] // 2 - 100, y_pos_top))
 
-    pygame.time.wait(5)
+
+def draw_end_screen(screen, message):
+    """Draw end game screen with a message."""
+    screen.fill(colors["black"])
+    font = pygame.font.SysFont(None, 80)
+    text = font.render(message, True, colors["white"])
+    center_coords = (screen_size[0] // 2, screen_size[1] // 2)
+    text_rect = text.get_rect(center=center_coords)
+    screen.blit(text, text_rect)
     pygame.display.flip()
+    pygame.time.wait(3000)
+
+
+def keyboard_inputs():
+    """Pressed actions from the arrow keys."""
+    keys = pygame.key.get_pressed()
+    inputs = []
+    if keys[pygame.K_RIGHT]:
+        inputs.append("right")
+    if keys[pygame.K_LEFT]:
+        inputs.append("left")
+    return inputs
+
+
+# FRAME TIMING
+class FrameStats:
+    """Frame times of the window loop: the whole frame (work plus the
+    clock's wait) and just the work done in it."""
+
+    def __init__(self, target_fps):
+        self.budget = 1000 / target_fps  # ms per frame
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.total = 0.0
+        self.work = 0.0
+        self.worst = 0.0
+        self.late = 0
+
+    def add(self, frame_ms, work_ms):
+        self.frames += 1
+        self.total += frame_ms
+        self.work += work_ms
+        self.worst = max(self.worst, frame_ms)
+        if work_ms > self.budget:
+            self.late += 1
+
+    def report(self):
+        if not self.frames:
+            return "no frames"
+        avg = self.total / self.frames
+        return (f"{self.frames} frames | {1000 / avg:.1f} FPS | "
+                f"frame {avg:.2f} ms (worst {self.worst:.2f}) | "
+                f"work {self.work / self.frames:.2f} ms | "
+                f"{self.late} over the {self.budget:.1f} ms budget")
+
 
-pygame.quit()
\ No newline at end of file
+# MAIN LOOP
+def main(fps=target_fps):
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode(screen_size)
+    pygame.display.set_caption("Break Out")
+    hud_font = pygame.font.SysFont(None, int(screen_size[1] * 0.05))
+
+    game = Breakout(load_sounds())
+    clock = pygame.time.Clock()
+    stats = FrameStats(fps)
+    accumulator = 0.0
+    end_game = False
+    while not end_game:
+        # Sleeps the rest of the frame, so the loop doesn't spin the CPU
+        frame_ms = clock.tick(fps)
+        stats.add(frame_ms, clock.get_rawtime())
+        accumulator += min(frame_ms / 1000, max_frame_time)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                end_game = True
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                print(stats.report())
+                stats.reset()
+
+        # Fixed steps: the same moves at any frame rate
+        inputs = keyboard_inputs()
+        while accumulator >= step_dt and not game.finished:
+            game.step(inputs)
+            accumulator -= step_dt
+
+        if game.finished:
+            draw_end_screen(screen, game.result)
+            break
+        draw_game(screen, game, hud_font)
+        pygame.display.flip()
+
+    print(stats.report())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Break Out")
+    parser.add_argument("--fps", type=int, default=target_fps,
+                        help="frames drawn per second")
+    parser.add_argument("--simulate", type=int, metavar="N",
+                        help="play N headless AI games instead, no window")
+    parser.add_argument("--max-steps", type=int, default=500000,
+                        help="cut off a simulated game after this many steps")
+    args = parser.parse_args()
+    if args.simulate:
+        simulate(args.simulate, max_steps=args.max_steps)
+    else:
+        main(args.fps)
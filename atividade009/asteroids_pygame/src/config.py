@@ -1,6 +1,8 @@
 WIDTH = 960
 HEIGHT = 720
 FPS = 60
+TICK_RATE = 120         # fixed simulation steps per second
+MAX_FRAME_TIME = 0.25   # longest frame fed to the simulation, in seconds
 
 START_LIVES = 3
 SAFE_SPAWN_TIME = 2.0   
@@ -26,6 +28,11 @@ BULLET_RADIUS = 2
 BULLET_TTL = 1.0
 MAX_BULLETS = 4
 
+SHOW_DEBUG_STATS = False  # draw bullet pool counters under the HUD
+ASYNC_AUDIO_LOADING = True  # decode sounds on a background thread
+
+GRID_CELL_SIZE = 96  # collision grid cell, about one large asteroid wide
+
 UFO_SPAWN_EVERY = 15.0  
 UFO_SPEED = 80.0
 UFO_BIG = {"r": 18, "score": 200, "aim": 0.2}
@@ -1,10 +1,18 @@
+import random
+import time
+
 import pygame as pg
 from systems import World
 from sound import SoundManager
 import config as C
+from utils import text_cache
 
 class Game:
     def __init__(self):
+        self.started = time.perf_counter()
+        # Seeded once per run: a restart keeps drawing from the same stream
+        if C.RANDOM_SEED is not None:
+            random.seed(C.RANDOM_SEED)
         pg.init()
         self.screen = pg.display.set_mode((C.WIDTH, C.HEIGHT))
         pg.display.set_caption("Asteroids")
@@ -23,9 +31,13 @@ class Game:
         self.running = True
         self.state = "start"     
 
+        self.step_dt = 1.0 / C.TICK_RATE
+        self.accumulator = 0.0
+        self.pending_actions = []
+
     def run(self):
         while self.running:
-            dt = self.clock.tick(C.FPS) / 1000.0
+            frame_dt = min(self.clock.tick(C.FPS) / 1000.0, C.MAX_FRAME_TIME)
             self.handle_events()
 
             if self.state == "start":
@@ -33,39 +45,57 @@ class Game:
 
             elif self.state == "playing":
                 keys = pg.key.get_pressed()
-                self.world.update(dt, keys)
-    
-                if getattr(self.world, "game_over", False):
-                    self.state = "gameover"
-                self.draw_game()
+                self.accumulator += frame_dt
+                while self.accumulator >= self.step_dt:
+                    self.step(keys)
+                    self.accumulator -= self.step_dt
+                    if self.world.game_over:
+                        self.state = "gameover"
+                        break
+
+                self.draw_game(self.accumulator / self.step_dt)
 
             elif self.state == "gameover":
                 self.draw_gameover()
 
             pg.display.flip()
+            if self.started is not None:
+                self.report_startup()
 
         pg.quit()
 
+    def report_startup(self):
+        first_frame = (time.perf_counter() - self.started) * 1000
+        self.started = None
+        mode = "background" if C.ASYNC_AUDIO_LOADING else "blocking"
+        print(f"[startup] first frame after {first_frame:.1f} ms (audio loading: {mode})")
+
     def draw_start_screen(self):
         self.screen.fill(C.BLACK)
-        text = self.font_big.render("ASTEROIDS", True, C.WHITE)
-        text2 = self.font_small.render("Maria Luiza Pereira Batista", True, C.WHITE)
-        text3 = self.font_small.render("Ranielly Jennifer Barroso Salvador", True, C.WHITE)
-        prompt = self.font_small.render("Press SPACE to start", True, C.GRAY)
+        text = text_cache.render(self.font_big, "ASTEROIDS", C.WHITE)
+        text2 = text_cache.render(self.font_small, "Maria Luiza Pereira Batista", C.WHITE)
+        text3 = text_cache.render(self.font_small, "Ranielly Jennifer Barroso Salvador", C.WHITE)
+        prompt = text_cache.render(self.font_small, "Press SPACE to start", C.GRAY)
         self.screen.blit(text, (C.WIDTH // 2 - text.get_width() // 2, 200))
         self.screen.blit(text2, (C.WIDTH // 2 - text.get_width() // 2, 500))
         self.screen.blit(text3, (C.WIDTH // 2 - text.get_width() // 2, 550))
         self.screen.blit(prompt, (C.WIDTH // 2 - prompt.get_width() // 2, 300))
 
-    def draw_game(self):
+    def step(self, keys):
+        for action in self.pending_actions:
+            action()
+        self.pending_actions.clear()
+        self.world.update(self.step_dt, keys)
+
+    def draw_game(self, alpha: float = 1.0):
         self.screen.fill(C.BLACK)
-        self.world.draw(self.screen, self.font_small)
+        self.world.draw(self.screen, self.font_small, alpha)
 
     def draw_gameover(self):
         self.screen.fill(C.BLACK)
-        text = self.font_big.render("GAME OVER", True, (255, 80, 80))
-        score = self.font_small.render(f"SCORE {self.world.score:06d}", True, C.WHITE)
-        prompt = self.font_small.render("Press SPACE to restart", True, C.GRAY)
+        text = text_cache.render(self.font_big, "GAME OVER", (255, 80, 80))
+        score = text_cache.render(self.font_small, f"SCORE {self.world.score:06d}", C.WHITE)
+        prompt = text_cache.render(self.font_small, "Press SPACE to restart", C.GRAY)
 
         self.screen.blit(text, (C.WIDTH // 2 - text.get_width() // 2, 200))
         self.screen.blit(score, (C.WIDTH // 2 - score.get_width() // 2, 300))
@@ -79,14 +109,19 @@ class Game:
                 self.running = False
             elif e.type == pg.KEYDOWN and e.key == pg.K_SPACE:
                 if self.state == "start":
-                    self.state = "playing"
+                    self.start_playing()
                 elif self.state == "gameover":
                    
                     self.world.reset()
-                    self.state = "playing"
+                    self.start_playing()
                 elif self.state == "playing":
                    
-                    self.world.try_fire()
+                    self.pending_actions.append(self.world.try_fire)
             elif e.type == pg.KEYDOWN and e.key == pg.K_LSHIFT:
                 if self.state == "playing":
-                    self.world.hyperspace()
+                    self.pending_actions.append(self.world.hyperspace)
+
+    def start_playing(self):
+        self.accumulator = 0.0
+        self.pending_actions.clear()
+        self.state = "playing"
@@ -0,0 +1,113 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import math
+import random
+import time
+
+import pygame as pg
+
+import config as C
+from sound import NullSoundManager
+from systems import World
+from utils import wrap_delta
+
+
+class SyntheticKeys:
+    """Stands in for pg.key.get_pressed(): keys not pressed read as False."""
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class AutoPilot:
+    """Simple bot: turns toward the nearest asteroid and shoots when aimed."""
+
+    def __init__(self, aim_tolerance: float = 8.0, keep_distance: float = 220.0):
+        self.aim_tolerance = aim_tolerance
+        self.keep_distance = keep_distance
+
+    def decide(self, world: World):
+        ship = world.ship
+        targets = list(world.asteroids) + list(world.ufos)
+        if not targets:
+            return SyntheticKeys(), False
+
+        deltas = [wrap_delta(ship.pos, t.pos) for t in targets]
+        delta = min(deltas, key=lambda d: d.length_squared())
+        wanted = math.degrees(math.atan2(delta.y, delta.x))
+        diff = (wanted - ship.angle + 180) % 360 - 180
+
+        pressed = []
+        if diff < -self.aim_tolerance:
+            pressed.append(pg.K_LEFT)
+        elif diff > self.aim_tolerance:
+            pressed.append(pg.K_RIGHT)
+        if delta.length() > self.keep_distance:
+            pressed.append(pg.K_UP)
+
+        fire = abs(diff) <= self.aim_tolerance * 2
+        return SyntheticKeys(pressed), fire
+
+
+def run_headless(game_seconds: float, tick_rate: int = C.TICK_RATE, seed=None):
+    if seed is not None:
+        random.seed(seed)
+
+    world = World(NullSoundManager())
+    pilot = AutoPilot()
+    dt = 1.0 / tick_rate
+    ticks = int(game_seconds * tick_rate)
+
+    games = []
+    start = time.perf_counter()
+    for _ in range(ticks):
+        keys, fire = pilot.decide(world)
+        if fire:
+            world.try_fire()
+        world.update(dt, keys)
+        if world.game_over:
+            games.append((world.score, world.wave))
+            world.reset()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "ticks": ticks,
+        "elapsed": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else float("inf"),
+        "speedup": game_seconds / elapsed if elapsed > 0 else float("inf"),
+        "games": games,
+        "current": (world.score, world.wave),
+        "bullet_pool": world.bullet_pool.stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Asteroids world without a window.")
+    parser.add_argument("--seconds", type=float, default=600.0, help="game time to simulate")
+    parser.add_argument("--tick-rate", type=int, default=C.TICK_RATE)
+    parser.add_argument("--seed", type=int, default=C.RANDOM_SEED)
+    args = parser.parse_args()
+
+    stats = run_headless(args.seconds, args.tick_rate, args.seed)
+    games = stats["games"]
+    print(f"ticks      {stats['ticks']}  in {stats['elapsed']:.2f}s")
+    print(f"ticks/s    {stats['ticks_per_second']:.0f}  ({stats['speedup']:.0f}x real time)")
+    print(f"games      {len(games)} finished")
+    if games:
+        print(f"best score {max(s for s, _ in games):06d}")
+        print(f"max wave   {max(w for _, w in games)}")
+    score, wave = stats["current"]
+    print(f"current    score {score:06d}  wave {wave}")
+    pool = stats["bullet_pool"]
+    print(f"bullets    created {pool['created']}  reused {pool['reused']}")
+
+
+if __name__ == "__main__":
+    main()
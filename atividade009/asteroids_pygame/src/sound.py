@@ -1,29 +1,109 @@
 import pygame as pg
 import os
+import threading
+import time
+
+import config as C
+
+
+class SoundHandle:
+    """Stands in for a pg.mixer.Sound; play() does nothing until it is loaded."""
+
+    def __init__(self, path: str, volume: float):
+        self.path = path
+        self.volume = volume
+        self.sound = None
+        self.error = None
+
+    def load(self):
+        try:
+            sound = pg.mixer.Sound(self.path)
+        except (FileNotFoundError, pg.error) as e:
+            self.error = str(e)
+            return
+        sound.set_volume(self.volume)
+        self.sound = sound
+
+    @property
+    def ready(self) -> bool:
+        return self.sound is not None
+
+    def play(self, *args, **kwargs):
+        sound = self.sound
+        if sound is not None:
+            return sound.play(*args, **kwargs)
+        return None
+
+    def set_volume(self, volume: float):
+        self.volume = volume
+        if self.sound is not None:
+            self.sound.set_volume(volume)
 
 
 class SoundManager:
-    def __init__(self):
+    # attribute -> (file, volume)
+    SOUNDS = {
+        "shoot_player": ("player_shoot.ogg", 0.3),
+        "player_die": ("player_die.ogg", 0.6),
+        "ufo_big_shoot": ("ufo_big_shoot.ogg", 0.4),
+        "ufo_big_die": ("ufo_big_die.ogg", 0.7),
+        "ufo_small_shoot": ("ufo_small_shoot.ogg", 0.4),
+        "ufo_small_die": ("ufo_small_die.ogg", 0.7),
+        "asteroid_hit": ("asteroid_hit.ogg", 0.5),
+    }
+
+    def __init__(self, background: bool = C.ASYNC_AUDIO_LOADING):
         pg.mixer.init()
 
         base_dir = os.path.dirname(os.path.abspath(__file__))
         base = os.path.join(base_dir, "assets", "sounds")
 
-        self.shoot_player = pg.mixer.Sound(os.path.join(base, "player_shoot.ogg"))
-        self.player_die = pg.mixer.Sound(os.path.join(base, "player_die.ogg"))
+        self.handles = []
+        for attr, (filename, volume) in self.SOUNDS.items():
+            handle = SoundHandle(os.path.join(base, filename), volume)
+            setattr(self, attr, handle)
+            self.handles.append(handle)
+
+        # Decoding happens off the main thread so the first frame is not
+        # held back; a missing file only silences its own handle.
+        self.started = time.perf_counter()
+        self.load_time = None
+        if background:
+            threading.Thread(target=self.load_all, daemon=True).start()
+        else:
+            self.load_all()
+
+    def load_all(self):
+        for handle in self.handles:
+            handle.load()
+            if handle.error:
+                print(f"[sound] could not load {os.path.basename(handle.path)}: {handle.error}")
+        self.load_time = time.perf_counter() - self.started
+        loaded = sum(h.ready for h in self.handles)
+        print(f"[sound] {loaded}/{len(self.handles)} sounds ready in {self.load_time * 1000:.1f} ms")
 
-        self.ufo_big_shoot = pg.mixer.Sound(os.path.join(base, "ufo_big_shoot.ogg"))
-        self.ufo_big_die = pg.mixer.Sound(os.path.join(base, "ufo_big_die.ogg"))
+    @property
+    def ready(self) -> bool:
+        return self.load_time is not None
 
-        self.ufo_small_shoot = pg.mixer.Sound(os.path.join(base, "ufo_small_shoot.ogg"))
-        self.ufo_small_die = pg.mixer.Sound(os.path.join(base, "ufo_small_die.ogg"))
 
-        self.asteroid_hit = pg.mixer.Sound(os.path.join(base, "asteroid_hit.ogg"))
+class SilentSound:
+    def play(self, *args, **kwargs):
+        return None
 
-        self.shoot_player.set_volume(0.3)
-        self.player_die.set_volume(0.6)
-        self.ufo_big_shoot.set_volume(0.4)
-        self.ufo_big_die.set_volume(0.7)
-        self.ufo_small_shoot.set_volume(0.4)
-        self.ufo_small_die.set_volume(0.7)
-        self.asteroid_hit.set_volume(0.5)
+    def set_volume(self, volume: float):
+        pass
+
+
+class NullSoundManager:
+    """Same sounds as SoundManager, but nothing is loaded or played."""
+
+    def __init__(self):
+        silent = SilentSound()
+        self.shoot_player = silent
+        self.player_die = silent
+        self.ufo_big_shoot = silent
+        self.ufo_big_die = silent
+        self.ufo_small_shoot = silent
+        self.ufo_small_die = silent
+        self.asteroid_hit = silent
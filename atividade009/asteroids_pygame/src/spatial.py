@@ -0,0 +1,61 @@
+import math
+from typing import Dict, Iterable, List
+
+import config as C
+from utils import Vec, wrap_delta
+
+
+class SpatialGrid:
+    """Uniform grid broadphase whose edges wrap around like wrap_pos.
+
+    Objects need ``pos`` and ``r``; each one is stored in every cell its
+    bounding circle touches, so a query only looks at nearby objects.
+    """
+
+    def __init__(self, cell_size: float = C.GRID_CELL_SIZE):
+        self.cols = max(1, int(C.WIDTH // cell_size))
+        self.rows = max(1, int(C.HEIGHT // cell_size))
+        self.cell_w = C.WIDTH / self.cols
+        self.cell_h = C.HEIGHT / self.rows
+        self.cells: Dict[int, List] = {}
+
+    def clear(self):
+        self.cells.clear()
+
+    def _cells_for(self, pos: Vec, r: float) -> set:
+        x0 = math.floor((pos.x - r) / self.cell_w)
+        x1 = math.floor((pos.x + r) / self.cell_w)
+        y0 = math.floor((pos.y - r) / self.cell_h)
+        y1 = math.floor((pos.y + r) / self.cell_h)
+        cols = {cx % self.cols for cx in range(x0, x1 + 1)}
+        rows = {cy % self.rows for cy in range(y0, y1 + 1)}
+        return {cy * self.cols + cx for cy in rows for cx in cols}
+
+    def insert(self, obj):
+        for key in self._cells_for(obj.pos, obj.r):
+            self.cells.setdefault(key, []).append(obj)
+
+    def build(self, objs: Iterable):
+        self.cells.clear()
+        for obj in objs:
+            self.insert(obj)
+
+    def candidates(self, pos: Vec, r: float) -> List:
+        seen = set()
+        found = []
+        for key in self._cells_for(pos, r):
+            for obj in self.cells.get(key, ()):
+                if obj not in seen:
+                    seen.add(obj)
+                    found.append(obj)
+        return found
+
+    def collide(self, pos: Vec, r: float) -> List:
+        """Live objects whose circle overlaps the circle (pos, r), wrap-aware."""
+        hits = []
+        for obj in self.candidates(pos, r):
+            if not obj.alive():
+                continue
+            if wrap_delta(pos, obj.pos).length() < r + obj.r:
+                hits.append(obj)
+        return hits
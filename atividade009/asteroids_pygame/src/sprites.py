@@ -1,48 +1,86 @@
 import math
 from random import uniform
+from typing import Optional
 
 import pygame as pg
 
 import config as C
-from utils import Vec, angle_to_vec, draw_circle, draw_poly, wrap_pos, rand_unit_vec
+from utils import Vec, angle_to_vec, draw_circle, draw_poly, lerp_wrapped, wrap_pos_ip, rand_unit_vec
 
 
 class Bullet(pg.sprite.Sprite):
-    def __init__(self, pos: Vec, vel: Vec):
+    def __init__(self, pos: Vec, vel: Vec, pool: Optional["BulletPool"] = None):
         super().__init__()
-        if pos is None:
-            self.pos = Vec(C.WIDTH / 2, C.HEIGHT / 2)
-        else:
-            try:
-                self.pos = Vec(pos)
-            except Exception:
-                self.pos = Vec(pos[0], pos[1])
-        self.vel = Vec(vel)
-        self.ttl = C.BULLET_TTL
+        self.pool = pool
+        self.pos = Vec()
+        self.prev_pos = Vec()
+        self.vel = Vec()
         self.r = C.BULLET_RADIUS
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
+        self.reset(pos, vel)
+
+    def reset(self, pos: Vec, vel: Vec):
+        self.pos.update(pos)
+        self.prev_pos.update(self.pos)
+        self.vel.update(vel)
+        self.ttl = C.BULLET_TTL
+        self.rect.center = self.pos
+
+    def kill(self):
+        was_alive = self.alive()
+        super().kill()
+        if was_alive and self.pool is not None:
+            self.pool.release(self)
 
     def update(self, dt: float):
+        self.prev_pos.update(self.pos)
         self.pos += self.vel * dt
-        self.pos = wrap_pos(self.pos)
+        wrap_pos_ip(self.pos)
         self.ttl -= dt
         if self.ttl <= 0:
             self.kill()
         self.rect.center = self.pos
 
-    def draw(self, surf: pg.Surface):
-        draw_circle(surf, self.pos, self.r)
+    def draw(self, surf: pg.Surface, alpha: float = 1.0):
+        draw_circle(surf, lerp_wrapped(self.prev_pos, self.pos, alpha), self.r)
+
+
+class BulletPool:
+    """Keeps killed bullets around so firing reuses them instead of allocating."""
+
+    def __init__(self):
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, pos: Vec, vel: Vec) -> Bullet:
+        if self.free:
+            b = self.free.pop()
+            b.reset(pos, vel)
+            self.reused += 1
+        else:
+            b = Bullet(pos, vel, self)
+            self.created += 1
+        return b
+
+    def release(self, b: Bullet):
+        self.free.append(b)
+
+    def stats(self) -> dict:
+        return {"created": self.created, "reused": self.reused, "free": len(self.free)}
 
 
 class Asteroid(pg.sprite.Sprite):
     def __init__(self, pos: Vec, vel: Vec, size: str):
         super().__init__()
         self.pos = Vec(pos)
+        self.prev_pos = Vec(self.pos)
         self.vel = Vec(vel)
         self.size = size
         self.r = C.AST_SIZES[size]["r"]
         self.poly = self._make_poly()
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
+        self._image = None
 
     def _make_poly(self):
         steps = 12 if self.size == "L" else 10 if self.size == "M" else 8
@@ -56,13 +94,44 @@ class Asteroid(pg.sprite.Sprite):
         return pts
 
     def update(self, dt: float):
+        self.prev_pos.update(self.pos)
         self.pos += self.vel * dt
-        self.pos = wrap_pos(self.pos)
+        wrap_pos_ip(self.pos)
         self.rect.center = self.pos
 
-    def draw(self, surf: pg.Surface):
-        pts = [(self.pos + p) for p in self.poly]
-        pg.draw.polygon(surf, C.WHITE, pts, width=1)
+    @property
+    def image(self) -> pg.Surface:
+        # Outline is rasterized once, on the first draw (headless runs skip it)
+        if self._image is None:
+            half = math.ceil(max(p.length() for p in self.poly)) + 1
+            self._image = pg.Surface((half * 2, half * 2))
+            self._image.set_colorkey(C.BLACK)
+            pts = [(p.x + half, p.y + half) for p in self.poly]
+            pg.draw.polygon(self._image, C.WHITE, pts, width=1)
+        return self._image
+
+    def blit_items(self, alpha: float = 1.0) -> list:
+        """(image, topleft) pairs, plus copies on the far side of any edge it crosses."""
+        image = self.image
+        half_w = image.get_width() / 2
+        half_h = image.get_height() / 2
+        pos = lerp_wrapped(self.prev_pos, self.pos, alpha)
+
+        xs = [pos.x]
+        if pos.x - half_w < 0:
+            xs.append(pos.x + C.WIDTH)
+        elif pos.x + half_w > C.WIDTH:
+            xs.append(pos.x - C.WIDTH)
+        ys = [pos.y]
+        if pos.y - half_h < 0:
+            ys.append(pos.y + C.HEIGHT)
+        elif pos.y + half_h > C.HEIGHT:
+            ys.append(pos.y - C.HEIGHT)
+
+        return [(image, (x - half_w, y - half_h)) for x in xs for y in ys]
+
+    def draw(self, surf: pg.Surface, alpha: float = 1.0):
+        surf.blits(self.blit_items(alpha), doreturn=False)
 
 
 class Ship(pg.sprite.Sprite):
@@ -75,8 +144,10 @@ class Ship(pg.sprite.Sprite):
 
             self.pos = Vec(C.WIDTH / 2, C.HEIGHT / 2)
 
+        self.prev_pos = Vec(self.pos)
         self.vel = Vec(0, 0)
         self.angle = -90.0
+        self.prev_angle = self.angle
         self.cool = 0.0
         self.invuln = 0.0
         self.alive = True
@@ -84,33 +155,40 @@ class Ship(pg.sprite.Sprite):
         self.rect = pg.Rect(0, 0, self.r * 2, self.r * 2)
 
     def control(self, keys: pg.key.ScancodeWrapper, dt: float):
+        self.prev_pos.update(self.pos)
+        self.prev_angle = self.angle
         if keys[pg.K_LEFT]:
             self.angle -= C.SHIP_TURN_SPEED * dt
         if keys[pg.K_RIGHT]:
             self.angle += C.SHIP_TURN_SPEED * dt
         if keys[pg.K_UP]:
             self.vel += angle_to_vec(self.angle) * C.SHIP_THRUST * dt
-        self.vel *= C.SHIP_FRICTION
+        self.vel *= C.SHIP_FRICTION ** (dt * C.FPS)
 
-    def fire(self):
+    def fire(self, pool: Optional[BulletPool] = None):
         if self.cool > 0:
             return None
         dirv = angle_to_vec(self.angle)
         pos = self.pos + dirv * (self.r + 6)
         vel = self.vel + dirv * C.SHIP_BULLET_SPEED
         self.cool = C.SHIP_FIRE_RATE
+        if pool is not None:
+            return pool.acquire(pos, vel)
         return Bullet(pos, vel)
 
     def hyperspace(self):
         self.pos = Vec(uniform(0, C.WIDTH), uniform(0, C.HEIGHT))
+        self.prev_pos.update(self.pos)
         self.vel.xy = (0, 0)
         self.invuln = 1.0
 
     def respawn(self):
 
         self.pos.xy = (C.WIDTH / 2, C.HEIGHT / 2)
+        self.prev_pos.update(self.pos)
         self.vel.xy = (0, 0)
         self.angle = -90.0
+        self.prev_angle = self.angle
         self.invuln = C.SAFE_SPAWN_TIME
         self.cool = 0.0
 
@@ -120,25 +198,28 @@ class Ship(pg.sprite.Sprite):
         if self.invuln > 0:
             self.invuln -= dt
         self.pos += self.vel * dt
-        self.pos = wrap_pos(self.pos)
+        wrap_pos_ip(self.pos)
         self.rect.center = self.pos
 
-    def draw(self, surf: pg.Surface):
-        dirv = angle_to_vec(self.angle)
-        left = angle_to_vec(self.angle + 140)
-        right = angle_to_vec(self.angle - 140)
-        p1 = self.pos + dirv * self.r
-        p2 = self.pos + left * self.r * 0.9
-        p3 = self.pos + right * self.r * 0.9
+    def draw(self, surf: pg.Surface, alpha: float = 1.0):
+        pos = lerp_wrapped(self.prev_pos, self.pos, alpha)
+        angle = self.prev_angle + (self.angle - self.prev_angle) * alpha
+        dirv = angle_to_vec(angle)
+        left = angle_to_vec(angle + 140)
+        right = angle_to_vec(angle - 140)
+        p1 = pos + dirv * self.r
+        p2 = pos + left * self.r * 0.9
+        p3 = pos + right * self.r * 0.9
         draw_poly(surf, [p1, p2, p3])
         if self.invuln > 0 and int(self.invuln * 10) % 2 == 0:
-            draw_circle(surf, self.pos, self.r + 6)
+            draw_circle(surf, pos, self.r + 6)
 
 
 class UFO(pg.sprite.Sprite):
     def __init__(self, pos: Vec, small: bool):
         super().__init__()
         self.pos = Vec(pos)
+        self.prev_pos = Vec(self.pos)
         self.small = small
         self.r = C.UFO_SMALL["r"] if small else C.UFO_BIG["r"]
         self.speed = C.UFO_SPEED
@@ -157,6 +238,7 @@ class UFO(pg.sprite.Sprite):
         self.cool = 0.0
 
     def _update_small_ufo_movement(self, dt: float, ship_pos: Vec):
+        self.prev_pos.update(self.pos)
         to_ship = ship_pos - self.pos
         if to_ship.length() > 0:
             desired = to_ship.normalize() * self.max_speed
@@ -176,16 +258,16 @@ class UFO(pg.sprite.Sprite):
 
     def update(self, dt: float):
         if not self.small:
-
+            self.prev_pos.update(self.pos)
             self.pos += self.dir * self.speed * dt
 
-        self.pos = wrap_pos(self.pos)
+        wrap_pos_ip(self.pos)
         self.rect.center = self.pos
 
         if self.cool > 0:
             self.cool -= dt
 
-    def fire(self, ship_pos: Vec):
+    def fire(self, ship_pos: Vec, pool: Optional[BulletPool] = None):
         if self.cool > 0:
             return None
 
@@ -203,14 +285,17 @@ class UFO(pg.sprite.Sprite):
 
         self.cool = 1.1 if self.small else 1.8
 
+        if pool is not None:
+            return pool.acquire(pos, vel)
         return Bullet(pos, vel)
 
-    def draw(self, surf: pg.Surface):
+    def draw(self, surf: pg.Surface, alpha: float = 1.0):
+        pos = lerp_wrapped(self.prev_pos, self.pos, alpha)
         w, h = self.r * 2, self.r
         rect = pg.Rect(0, 0, w, h)
-        rect.center = self.pos
+        rect.center = pos
         pg.draw.ellipse(surf, C.WHITE, rect, width=1)
 
         cup = pg.Rect(0, 0, w * 0.5, h * 0.7)
-        cup.center = (self.pos.x, self.pos.y - h * 0.3)
+        cup.center = (pos.x, pos.y - h * 0.3)
         pg.draw.ellipse(surf, C.WHITE, cup, width=1)
@@ -4,14 +4,19 @@ from random import uniform
 import pygame as pg
 
 import config as C
-from sprites import Asteroid, Ship, UFO, Bullet
-from utils import Vec, rand_edge_pos, rand_unit_vec
+from spatial import SpatialGrid
+from sprites import Asteroid, Ship, UFO, Bullet, BulletPool
+from utils import Vec, rand_edge_pos, rand_unit_vec, text_cache
 
 
 class World:
 
     def __init__(self, sound):
         self.sound = sound
+        self.bullet_pool = BulletPool()
+        self.ast_grid = SpatialGrid()
+        self.ufo_grid = SpatialGrid()
+        self.bullet_grid = SpatialGrid()
         self.reset()
 
     def reset(self):
@@ -50,6 +55,7 @@ class World:
         a = Asteroid(pos, vel, size)
         self.asteroids.add(a)
         self.all_sprites.add(a)
+        self.ast_grid.insert(a)
 
     def spawn_ufo(self):
         small = uniform(0, 1) < 0.5
@@ -62,7 +68,7 @@ class World:
     def try_fire(self):
         if len(self.bullets) >= C.MAX_BULLETS:
             return
-        b = self.ship.fire()
+        b = self.ship.fire(self.bullet_pool)
         if b:
             self.bullets.add(b)
             self.all_sprites.add(b)
@@ -103,7 +109,7 @@ class World:
                     ufo._update_small_ufo_movement(dt, self.ship.pos)
 
         for ufo in list(self.ufos):
-            shot = ufo.fire(self.ship.pos)
+            shot = ufo.fire(self.ship.pos, self.bullet_pool)
             if shot:
                 self.ufo_bullets.add(shot)
                 self.all_sprites.add(shot)
@@ -123,59 +129,57 @@ class World:
 
     def handle_collisions(self):
 
-        hits = pg.sprite.groupcollide(
-            self.asteroids,
-            self.bullets,
-            False,
-            True,
-            collided=lambda a, b: (a.pos - b.pos).length() < a.r,
-        )
-        for ast, _ in hits.items():
+        self.ast_grid.build(self.asteroids)
+        self.ufo_grid.build(self.ufos)
+        self.bullet_grid.build(self.ufo_bullets)
+
+        hit_asteroids = []
+        for b in list(self.bullets):
+            hits = self.ast_grid.collide(b.pos, 0)
+            if hits:
+                b.kill()
+                for ast in hits:
+                    if ast not in hit_asteroids:
+                        hit_asteroids.append(ast)
+        for ast in hit_asteroids:
             self.split_asteroid(ast)
             if hasattr(self.sound, "asteroid_hit"):
                 self.sound.asteroid_hit.play()
 
+        for b in list(self.bullets):
+            hits = self.ufo_grid.collide(b.pos, b.r)
+            if hits:
+                ufo = hits[0]
+                score = C.UFO_SMALL["score"] if ufo.small else C.UFO_BIG["score"]
+                self.score += score
+                ufo.kill()
+                b.kill()
+                self.play_ufo_die(ufo)
+
         for ufo in list(self.ufos):
-            for b in list(self.bullets):
-                if (ufo.pos - b.pos).length() < (ufo.r + b.r):
-                    score = C.UFO_SMALL["score"] if ufo.small else C.UFO_BIG["score"]
-                    self.score += score
-                    ufo.kill()
-                    b.kill()
-                    if ufo.small and hasattr(self.sound, "ufo_small_die"):
-                        self.sound.ufo_small_die.play()
-                    elif not ufo.small and hasattr(self.sound, "ufo_big_die"):
-                        self.sound.ufo_big_die.play()
-
-        for ast in list(self.asteroids):
-            for ufo in list(self.ufos):
-                if (ast.pos - ufo.pos).length() < (ast.r + ufo.r):
-                    ufo.kill()
-
-                    if ufo.small and hasattr(self.sound, "ufo_small_die"):
-                        self.sound.ufo_small_die.play()
-                    elif not ufo.small and hasattr(self.sound, "ufo_big_die"):
-                        self.sound.ufo_big_die.play()
-                    break
+            if self.ast_grid.collide(ufo.pos, ufo.r):
+                ufo.kill()
+                self.play_ufo_die(ufo)
 
         if self.ship.invuln <= 0 and self.safe <= 0:
-            for b in list(self.ufo_bullets):
-                if (b.pos - self.ship.pos).length() < (b.r + self.ship.r):
-                    b.kill()
-                    self.ship_die()
-                    break
+            hits = self.bullet_grid.collide(self.ship.pos, self.ship.r)
+            if hits:
+                hits[0].kill()
+                self.ship_die()
 
         if self.ship.invuln <= 0 and self.safe <= 0:
-            for ast in self.asteroids:
-                if (ast.pos - self.ship.pos).length() < (ast.r + self.ship.r):
-                    self.ship_die()
-                    break
+            if self.ast_grid.collide(self.ship.pos, self.ship.r):
+                self.ship_die()
 
         if self.ship.invuln <= 0 and self.safe <= 0:
-            for ufo in self.ufos:
-                if (ufo.pos - self.ship.pos).length() < (ufo.r + self.ship.r):
-                    self.ship_die()
-                    break
+            if self.ufo_grid.collide(self.ship.pos, self.ship.r):
+                self.ship_die()
+
+    def play_ufo_die(self, ufo: UFO):
+        if ufo.small and hasattr(self.sound, "ufo_small_die"):
+            self.sound.ufo_small_die.play()
+        elif not ufo.small and hasattr(self.sound, "ufo_big_die"):
+            self.sound.ufo_big_die.play()
 
     def split_asteroid(self, ast: Asteroid):
         self.score += C.AST_SIZES[ast.size]["score"]
@@ -200,20 +204,29 @@ class World:
         if self.lives < 0:
             self.game_over = True
 
-    def draw(self, surf: pg.Surface, font: pg.font.Font = None):
+    def draw(self, surf: pg.Surface, font: pg.font.Font = None, alpha: float = 1.0):
 
+        batch = []
         for a in self.asteroids:
-            a.draw(surf)
+            batch.extend(a.blit_items(alpha))
+        surf.blits(batch, doreturn=False)
         for u in self.ufos:
-            u.draw(surf)
+            u.draw(surf, alpha)
         for b in self.bullets:
-            b.draw(surf)
+            b.draw(surf, alpha)
         for b in self.ufo_bullets:
-            b.draw(surf)
-        self.ship.draw(surf)
+            b.draw(surf, alpha)
+        self.ship.draw(surf, alpha)
 
         if font is not None:
             pg.draw.line(surf, (60, 60, 60), (0, 50), (C.WIDTH, 50), width=1)
             txt = f"SCORE {self.score:06d}   LIVES {self.lives}   WAVE {self.wave}"
-            label = font.render(txt, True, C.WHITE)
+            label = text_cache.render(font, txt, C.WHITE)
             surf.blit(label, (10, 10))
+
+            if C.SHOW_DEBUG_STATS:
+                stats = self.bullet_pool.stats()
+                txt = (f"BULLETS created {stats['created']}  "
+                       f"reused {stats['reused']}  free {stats['free']}")
+                label = text_cache.render(font, txt, C.GRAY)
+                surf.blit(label, (10, 30))
@@ -1,5 +1,7 @@
 
 import math
+import sys
+from pathlib import Path
 from random import random, uniform
 from typing import Iterable, Tuple
 
@@ -7,6 +9,10 @@ import pygame as pg
 
 import config as C
 
+# Repository root on the path, for the modules shared by the games
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from shared.text_cache import text_cache  # noqa: E402,F401
+
 Vec = pg.math.Vector2
 
 
@@ -14,6 +20,22 @@ def wrap_pos(pos: Vec) -> Vec:
     return Vec(pos.x % C.WIDTH, pos.y % C.HEIGHT)
 
 
+def wrap_pos_ip(pos: Vec) -> Vec:
+    pos.x %= C.WIDTH
+    pos.y %= C.HEIGHT
+    return pos
+
+
+def wrap_delta(a: Vec, b: Vec) -> Vec:
+    dx = (b.x - a.x + C.WIDTH / 2) % C.WIDTH - C.WIDTH / 2
+    dy = (b.y - a.y + C.HEIGHT / 2) % C.HEIGHT - C.HEIGHT / 2
+    return Vec(dx, dy)
+
+
+def lerp_wrapped(prev: Vec, pos: Vec, alpha: float) -> Vec:
+    return wrap_pos(prev + wrap_delta(prev, pos) * alpha)
+
+
 def angle_to_vec(deg: float) -> Vec:
     rad = math.radians(deg)
     return Vec(math.cos(rad), math.sin(rad))
@@ -43,6 +65,6 @@ def draw_circle(surface: pg.Surface, pos: Vec, r: int):
 
 
 def text(surface: pg.Surface, font: pg.font.Font, s: str, x: int, y: int):
-    surf = font.render(s, True, C.WHITE)
+    surf = text_cache.render(font, s, C.WHITE)
     rect = surf.get_rect(topleft=(x, y))
     surface.blit(surf, rect)
@@ -0,0 +1,118 @@
+import json
+import os
+
+import pygame
+
+from utils import build_path
+# utils já pôs a raiz do repositório no path
+from shared.atlas import fingerprint, is_fresh, pack_shelves, to_palette
+
+# =====================================================
+# ATLAS DE TEXTURAS
+# =====================================================
+# Todas as spritesheets de assets/sprites numa imagem só + índice JSON com
+# o retângulo de cada uma. Gerar de novo sempre que um PNG mudar:
+#     python atlas.py
+# O índice guarda tamanho, mtime e hash de cada PNG; uma spritesheet que
+# mudou depois do atlas é lida do arquivo solto (com aviso).
+
+SPRITES_DIR = "assets/sprites"
+ATLAS_IMAGE = "assets/atlas.png"
+ATLAS_INDEX = "assets/atlas.json"
+
+PADDING = 1        # pixels entre spritesheets
+MAX_WIDTH = 1024
+
+
+def bake():
+    """Passo de build: junta as spritesheets e grava atlas + índice."""
+    paths = []
+    for root, _, files in os.walk(build_path(SPRITES_DIR)):
+        for name in files:
+            if name.lower().endswith(".png"):
+                full = os.path.join(root, name)
+                paths.append(os.path.relpath(full, build_path("")).replace(os.sep, "/"))
+    paths.sort()
+
+    # convert_alpha: colorkey vira alfa, igual ao load_spritesheet
+    sheets = [pygame.image.load(build_path(p)).convert_alpha() for p in paths]
+    sizes = [s.get_size() for s in sheets]
+    positions, size = pack_shelves(sizes, max([MAX_WIDTH] + [w for w, _ in sizes]),
+                                   PADDING)
+
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    index = {"colorkey": None, "sheets": {}, "sources": {}}
+    for path, sheet, (x, y) in zip(paths, sheets, positions):
+        # MAX sobre o fundo zerado copia RGBA exato (sem mistura de alfa)
+        atlas.blit(sheet, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        index["sheets"][path] = [x, y, sheet.get_width(), sheet.get_height()]
+        index["sources"][path] = fingerprint(build_path(path))
+
+    # Com paleta o PNG decodifica bem mais rápido que RGBA
+    atlas, index["colorkey"] = to_palette(atlas)
+    pygame.image.save(atlas, build_path(ATLAS_IMAGE))
+    with open(build_path(ATLAS_INDEX), "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+    print(f"Atlas {size[0]}x{size[1]} com {len(paths)} spritesheets -> {ATLAS_IMAGE}")
+
+
+class TextureAtlas:
+    """Atlas carregado uma vez; as spritesheets saem como subsurfaces."""
+
+    def __init__(self, image, rects):
+        self.image = image
+        self.rects = rects
+
+    @classmethod
+    def load(cls):
+        """Lê atlas + índice, ou devolve None se o atlas não foi gerado (ou
+        se nenhuma spritesheet dele está em dia)."""
+        image_path = build_path(ATLAS_IMAGE)
+        index_path = build_path(ATLAS_INDEX)
+        if not (os.path.exists(image_path) and os.path.exists(index_path)):
+            return None
+        with open(index_path) as f:
+            index = json.load(f)
+
+        # Só fica no atlas o que não mudou desde o bake
+        sources = index.get("sources", {})
+        rects = {path: rect for path, rect in index["sheets"].items()
+                 if is_fresh(build_path(path), sources.get(path))}
+        stale = len(index["sheets"]) - len(rects)
+        if stale:
+            print(f"[AVISO] atlas desatualizado: {stale} spritesheet(s) mudaram "
+                  f"e serão lidas dos PNGs; rode python atlas.py")
+        if not rects:
+            return None
+
+        image = pygame.image.load(image_path)
+        if index["colorkey"] is not None:
+            image.set_colorkey(index["colorkey"])
+        return cls(image.convert_alpha(), rects)
+
+    def __contains__(self, path):
+        return path in self.rects
+
+    def frames(self, path, frame_width, frame_height):
+        """Fatia a spritesheet `path` como load_spritesheet, mas sem ler
+        arquivo nem copiar pixels."""
+        sheet = self.image.subsurface(self.rects[path])
+        sw, sh = sheet.get_size()
+
+        frames = []
+        for y in range(0, sh, frame_height):
+            for x in range(0, sw, frame_width):
+                if x + frame_width > sw or y + frame_height > sh:
+                    continue
+                frames.append(sheet.subsurface((x, y, frame_width, frame_height)))
+        return frames
+
+
+if __name__ == "__main__":
+    # convert_alpha precisa de uma janela; no build ela nem aparece
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    bake()
+    pygame.quit()
@@ -2,6 +2,15 @@ WIDTH = 1024
 HEIGHT = 720
 FPS = 60
 
+# Renderização por retângulos sujos (F3 alterna com redesenho total)
+DIRTY_RECT_RENDERING = True
+
+# Áudio decodificado em segundo plano (o menu aparece sem esperar os MP3)
+ASYNC_AUDIO_LOADING = True
+
+# Modo multidão: NPCs simulados em arrays NumPy (para fases com 1000+ NPCs)
+CROWD_MODE = False
+
 PLAYER_SPEED = 220
 NPC_SPEED = 100  
 
@@ -9,6 +18,16 @@ SPRITE_DIR = "assets/caramel"
 NPC_DIR = "assets/dobermann"
 
 FRAME_SIZE = 48
+GRID_CELL_SIZE = FRAME_SIZE  # célula da grade espacial de colisão
+
+# Campo de fluxo dos Dobermanns (perseguição)
+FLOW_CELL_SIZE = 32
+FLOW_UPDATE_INTERVAL = 0.25  # no máximo 4 BFS por segundo
+
+# Spawn das fases (disco de Poisson)
+SPAWN_SPACING = FRAME_SIZE       # distância mínima entre NPCs/galinhas
+SPAWN_PLAYER_DISTANCE = 150      # distância mínima até o player
+SPAWN_ATTEMPTS = 30              # tentativas por ponto (custo limitado)
 
 BORDER_THICKNESS = 10
 TOP_BORDER_THICKNESS = BORDER_THICKNESS + 30
@@ -0,0 +1,160 @@
+try:
+    import numpy as np
+except ImportError:  # modo multidão é opcional
+    np = None
+
+from sprites import DobermannNPC
+
+
+class CrowdSystem:
+    """Modo multidão: a simulação dos NPCs roda em arrays NumPy.
+
+    Posições, direções, velocidades, timers, frames de animação e limites
+    de todos os NPCs ficam em arrays e avançam num único passo vetorizado
+    por tipo de comportamento (cães perseguem o player, gatos e galinhas
+    vagueiam). Os sprites só recebem o resultado para desenhar.
+    """
+
+    def __init__(self, bounds, seed=None):
+        if np is None:
+            raise RuntimeError("o modo multidão precisa do NumPy instalado")
+        self.bounds = bounds
+        self.rng = np.random.default_rng(seed)
+        self.player = None
+        self.flow_field = None
+        self.flow_version = None
+        self.sprites = []
+        self.index = {}
+        self._alloc(0)
+
+    def _alloc(self, n):
+        self.pos = np.zeros((n, 2))
+        self.dir = np.zeros((n, 2))
+        self.speed = np.zeros(n)
+        self.timer = np.zeros(n)
+        self.change_lo = np.zeros(n)
+        self.change_hi = np.zeros(n)
+        self.chaser = np.zeros(n, dtype=bool)
+        self.active = np.zeros(n, dtype=bool)
+        # Animação (mesma lógica de Entity.set_anim/animate)
+        self.moving = np.zeros(n, dtype=bool)
+        self.facing_left = np.zeros(n, dtype=bool)
+        self.frame = np.zeros(n, dtype=np.int64)
+        self.frame_time = np.zeros(n)
+        self.frame_speed = np.zeros(n)
+        self.len_idle = np.ones(n, dtype=np.int64)
+        self.len_walk = np.ones(n, dtype=np.int64)
+
+    def rebuild(self, sprites, player, flow_field=None):
+        """Copia o estado dos sprites da fase para os arrays."""
+        self.player = player
+        self.flow_field = flow_field
+        self.flow_version = None
+        self.sprites = list(sprites)
+        self.index = {s: i for i, s in enumerate(self.sprites)}
+        self._alloc(len(self.sprites))
+
+        for i, s in enumerate(self.sprites):
+            self.pos[i] = (s.x, s.y)
+            self.dir[i] = (s.dx, s.dy)
+            self.speed[i] = s.speed
+            self.timer[i] = getattr(s, "change_time", 0.0)
+            self.change_lo[i], self.change_hi[i] = getattr(s, "change_range", (0.0, 0.0))
+            self.chaser[i] = isinstance(s, DobermannNPC)
+            self.active[i] = s.alive()
+            self.moving[i] = s.current_anim is s.anim_walk
+            self.facing_left[i] = s.facing_left
+            self.frame[i] = s.frame
+            self.frame_time[i] = s.frame_time
+            self.frame_speed[i] = s.frame_speed
+            self.len_idle[i] = max(1, len(s.anim_idle))
+            self.len_walk[i] = max(1, len(s.anim_walk))
+
+    def sync_sprite(self, sprite):
+        """Atualiza o array quando alguém mexe no sprite por fora (ex.: knockback)."""
+        i = self.index.get(sprite)
+        if i is not None:
+            self.pos[i] = (sprite.x, sprite.y)
+
+    def _flow_targets(self, pos, player_pos):
+        ff = self.flow_field
+        if self.flow_version != ff.version:
+            self.flow_next = np.column_stack((ff.next_x, ff.next_y))
+            self.flow_valid = np.array(ff.valid, dtype=bool)
+            self.flow_version = ff.version
+
+        cx = ((pos[:, 0] - ff.bounds.x) // ff.cell_size).astype(np.int64)
+        cy = ((pos[:, 1] - ff.bounds.y) // ff.cell_size).astype(np.int64)
+        np.clip(cx, 0, ff.cols - 1, out=cx)
+        np.clip(cy, 0, ff.rows - 1, out=cy)
+        cell = cy * ff.cols + cx
+        valid = self.flow_valid[cell]
+        return np.where(valid[:, None], self.flow_next[cell], player_pos)
+
+    def update(self, dt):
+        self.steer(dt)
+        self.move(dt)
+
+    def steer(self, dt):
+        """Etapa de IA: escolhe a direção de todos os NPCs em lote."""
+        if not self.sprites:
+            return
+
+        # Cães: direção normalizada até o player (ou até a próxima célula
+        # do campo de fluxo, amostrado para todos de uma vez)
+        if self.player is not None:
+            chase = self.chaser
+            target = np.array((self.player.x, self.player.y))
+            pos = self.pos[chase]
+            if self.flow_field is not None:
+                target = self._flow_targets(pos, target)
+            delta = target - pos
+            d = np.maximum(1.0, np.hypot(delta[:, 0], delta[:, 1]))
+            self.dir[chase] = delta / d[:, None]
+
+        # Gatos e galinhas: sorteia nova direção quando o timer zera
+        wander = ~self.chaser
+        self.timer[wander] -= dt
+        due = wander & (self.timer <= 0)
+        k = int(due.sum())
+        if k:
+            self.dir[due] = self.rng.integers(-1, 2, size=(k, 2))
+            self.timer[due] = self.rng.uniform(self.change_lo[due], self.change_hi[due])
+
+    def move(self, dt):
+        """Etapa de movimento: aplica as direções, anima e devolve aos sprites."""
+        if not self.sprites:
+            return
+
+        # Troca idle/walk reinicia a animação; orientação segue o dx
+        dx = self.dir[:, 0]
+        moving = (dx != 0) | (self.dir[:, 1] != 0)
+        changed = moving != self.moving
+        self.frame[changed] = 0
+        self.frame_time[changed] = 0
+        self.moving = moving
+        self.facing_left = np.where(dx < 0, True, np.where(dx > 0, False, self.facing_left))
+
+        # Movimento + limites da cerca (mesmo clamp de Entity.move)
+        self.pos += self.dir * (self.speed * dt)[:, None]
+        bx, by, bw, bh = self.bounds
+        np.clip(self.pos[:, 0], bx, bx + bw, out=self.pos[:, 0])
+        np.clip(self.pos[:, 1], by, by + bh, out=self.pos[:, 1])
+
+        # Avanço dos frames
+        self.frame_time += dt
+        advance = self.frame_time >= self.frame_speed
+        self.frame_time[advance] = 0
+        n_frames = np.where(moving, self.len_walk, self.len_idle)
+        self.frame = np.where(advance, (self.frame + 1) % n_frames, self.frame)
+
+        # Devolve o resultado para os sprites (desenho)
+        rows = zip(self.sprites, self.active.tolist(), self.pos.tolist(),
+                   self.dir.tolist(), self.frame.tolist(), self.facing_left.tolist())
+        for i, (s, active, (x, y), (ddx, ddy), frame, facing) in enumerate(rows):
+            if not active:
+                continue
+            if not s.alive():
+                self.active[i] = False
+                continue
+            s.sync_from_crowd(x, y, ddx, ddy, frame, facing)
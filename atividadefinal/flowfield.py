@@ -0,0 +1,137 @@
+import pygame
+from collections import deque
+
+
+class FlowField:
+    """Campo de fluxo em grade apontando para o player.
+
+    Um único BFS (8 vizinhos) a partir da célula do player calcula, para
+    cada célula livre, qual a próxima célula do caminho. Os cães só
+    consultam a célula onde estão, em O(1), em vez de cada um buscar seu
+    próprio caminho. O BFS roda no máximo a cada `interval` segundos e só
+    quando o player muda de célula.
+    """
+
+    NEIGHBORS = [(-1, 0), (1, 0), (0, -1), (0, 1),
+                 (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+    def __init__(self, bounds, cell_size, obstacles=(), interval=0.25):
+        self.bounds = bounds
+        self.cell_size = cell_size
+        self.interval = interval
+        self.cols = max(1, -(-bounds.width // cell_size))
+        self.rows = max(1, -(-bounds.height // cell_size))
+        self.cooldown = 0.0
+        self.target_cell = None
+        self.version = 0  # muda a cada BFS (o modo multidão usa para cache)
+        self.set_obstacles(obstacles)
+
+    def set_obstacles(self, obstacles):
+        """Marca como bloqueadas as células que tocam algum obstáculo."""
+        self.obstacles = list(obstacles)
+        self.blocked = [False] * (self.cols * self.rows)
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                cell = self.cell_rect(cx, cy)
+                if cell.collidelist(self.obstacles) != -1:
+                    self.blocked[cy * self.cols + cx] = True
+        self.target_cell = None
+
+    def cell_rect(self, cx, cy):
+        cs = self.cell_size
+        return pygame.Rect(self.bounds.x + cx * cs, self.bounds.y + cy * cs, cs, cs)
+
+    def cell_of(self, x, y):
+        cx = int((x - self.bounds.x) // self.cell_size)
+        cy = int((y - self.bounds.y) // self.cell_size)
+        cx = min(max(cx, 0), self.cols - 1)
+        cy = min(max(cy, 0), self.rows - 1)
+        return cx, cy
+
+    def cell_center(self, cx, cy):
+        cs = self.cell_size
+        return (self.bounds.x + cx * cs + cs / 2, self.bounds.y + cy * cs + cs / 2)
+
+    def update(self, dt, px, py):
+        """Refaz o BFS se o player mudou de célula e o intervalo já passou."""
+        self.cooldown -= dt
+        cell = self.cell_of(px, py)
+        if cell != self.target_cell and (self.cooldown <= 0 or self.target_cell is None):
+            self.rebuild(cell)
+
+    def rebuild(self, target_cell):
+        cols, rows = self.cols, self.rows
+        tx, ty = target_cell
+        n = cols * rows
+        dist = [-1] * n
+        dist[ty * cols + tx] = 0
+
+        queue = deque([target_cell])
+        while queue:
+            cx, cy = queue.popleft()
+            d = dist[cy * cols + cx] + 1
+            for ox, oy in self.NEIGHBORS:
+                nx, ny = cx + ox, cy + oy
+                if not (0 <= nx < cols and 0 <= ny < rows):
+                    continue
+                i = ny * cols + nx
+                if dist[i] != -1 or self.blocked[i] or self._corner_blocked(cx, cy, ox, oy):
+                    continue
+                dist[i] = d
+                queue.append((nx, ny))
+
+        # Próxima célula: vizinho com menor distância; empate vai para o
+        # vizinho mais perto do alvo em linha reta (caminho menos serrilhado)
+        next_x = [0.0] * n
+        next_y = [0.0] * n
+        valid = [False] * n
+        for cy in range(rows):
+            for cx in range(cols):
+                i = cy * cols + cx
+                if dist[i] <= 0:
+                    continue
+                best = None
+                for ox, oy in self.NEIGHBORS:
+                    nx, ny = cx + ox, cy + oy
+                    if not (0 <= nx < cols and 0 <= ny < rows):
+                        continue
+                    j = ny * cols + nx
+                    if dist[j] == -1 or self._corner_blocked(cx, cy, ox, oy):
+                        continue
+                    key = (dist[j], (nx - tx) ** 2 + (ny - ty) ** 2)
+                    if best is None or key < best[0]:
+                        best = (key, nx, ny)
+                if best is not None:
+                    next_x[i], next_y[i] = self.cell_center(best[1], best[2])
+                    valid[i] = True
+
+        self.dist = dist
+        self.next_x = next_x
+        self.next_y = next_y
+        self.valid = valid
+        self.target_cell = target_cell
+        self.cooldown = self.interval
+        self.version += 1
+
+    def _corner_blocked(self, cx, cy, ox, oy):
+        # Diagonal não pode cortar a quina de um obstáculo
+        if ox == 0 or oy == 0:
+            return False
+        return (self.blocked[cy * self.cols + cx + ox] or
+                self.blocked[(cy + oy) * self.cols + cx])
+
+    def direction(self, x, y, px, py):
+        """Direção normalizada para seguir o campo a partir de (x, y).
+
+        Na célula do player (ou sem caminho) vai em linha reta até ele.
+        """
+        cx, cy = self.cell_of(x, y)
+        i = cy * self.cols + cx
+        if self.valid[i]:
+            tx, ty = self.next_x[i], self.next_y[i]
+        else:
+            tx, ty = px, py
+        dx = tx - x
+        dy = ty - y
+        d = max(1, (dx*dx + dy*dy)**0.5)
+        return dx / d, dy / d
@@ -1,15 +1,25 @@
-from math import dist
+import time
+
 import pygame
-import random
 
 # Importe as cores novas do config
 from config import WIDTH, HEIGHT, FPS, BORDER_THICKNESS, TOP_BORDER_THICKNESS, \
-    WHITE, BLACK, BUTTON_COLOR, BUTTON_HOVER_COLOR, BACKGROUND_COLOR
+    WHITE, BLACK, BUTTON_COLOR, BUTTON_HOVER_COLOR, BACKGROUND_COLOR, GRID_CELL_SIZE, \
+    DIRTY_RECT_RENDERING, CROWD_MODE, FLOW_CELL_SIZE, FLOW_UPDATE_INTERVAL, \
+    SPAWN_SPACING, SPAWN_PLAYER_DISTANCE, SPAWN_ATTEMPTS, ASYNC_AUDIO_LOADING
 from sprites import Player, DobermannNPC, BlackCatNPC, OrangeCatNPC, Chicken
 from sound import SoundManager
+from spatial import SpatialHash
+from crowd import CrowdSystem
+from flowfield import FlowField
+from spawn import SpawnPlanner, EntityPool, PhasePreparer
+from systems import SystemScheduler, InputSystem, AISystem, MovementSystem, \
+    CollisionSystem, AudioSystem, RenderSystem, PrepSystem
+from utils import text_cache
 
 class Game:
     def __init__(self):
+        self.started = time.perf_counter()  # para medir o tempo até o 1º frame
         pygame.init()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Caramel Adventures")
@@ -39,8 +49,9 @@ class Game:
         self.sound_manager = SoundManager()
 
         # Grupos de Sprites
-        self.all_sprites = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.LayeredDirty()
         self.chickens = pygame.sprite.Group()
+        self.npcs = pygame.sprite.Group()  # cães e gatos (sem player e galinhas)
         self.menu_sprites = pygame.sprite.Group() # Grupo separado para o menu
 
         # ----------------------------------------------------
@@ -85,9 +96,65 @@ class Game:
         )
         self.player.set_bounds(self.bounds)
 
+        # Fundo da fase (imagem/cor + cerca) usado para apagar sprites e HUD
+        self.play_background = pygame.Surface((WIDTH, HEIGHT)).convert()
+        if self.has_background:
+            self.play_background.blit(self.background, (0, 0))
+        else:
+            self.play_background.fill(BACKGROUND_COLOR)
+        pygame.draw.rect(self.play_background, WHITE, self.bounds, 2)
+
+        # Retângulos sujos: só o que mudou vai para a tela
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.full_redraw = True
+        self.hud_rects = []
+
+        # Grades espaciais para colisão/proximidade (reconstruídas a cada tick)
+        self.npc_grid = SpatialHash(GRID_CELL_SIZE)
+        self.chicken_grid = SpatialHash(GRID_CELL_SIZE)
+
+        # Obstáculos dentro da cerca (por enquanto nenhum) e o campo de
+        # fluxo que os Dobermanns seguem até o player
+        self.obstacles = []
+        self.flow_field = FlowField(self.bounds, FLOW_CELL_SIZE,
+                                    self.obstacles, FLOW_UPDATE_INTERVAL)
+        # Campo reserva: a próxima fase é calculada nele em segundo plano
+        self.spare_flow_field = FlowField(self.bounds, FLOW_CELL_SIZE,
+                                          self.obstacles, FLOW_UPDATE_INTERVAL)
+
+        # Posições de spawn de cada fase, planejadas todas de uma vez
+        self.spawn_planner = SpawnPlanner(self.bounds, SPAWN_SPACING,
+                                          SPAWN_PLAYER_DISTANCE, SPAWN_ATTEMPTS)
+
+        # Pools por tipo: reset_phase/next_phase reaproveitam as entidades
+        self.pools = {cls: EntityPool(cls) for cls in
+                      (DobermannNPC, BlackCatNPC, OrangeCatNPC, Chicken)}
+
+        # Próxima fase preparada enquanto a atual roda
+        self.preparer = PhasePreparer(self.spawn_planner, self.pools)
+
+        # Modo multidão (opcional): NPCs avançam em lote com NumPy
+        self.crowd = None
+        if CROWD_MODE:
+            try:
+                self.crowd = CrowdSystem(self.bounds)
+            except RuntimeError as e:
+                print(f"[AVISO] {e}; usando update por sprite.")
+
         # Variável para controlar o cooldown do som de HISS
         self.hiss_cooldown = 0 
 
+        # Etapas do tick de gameplay, na ordem em que rodam
+        self.systems = SystemScheduler([
+            InputSystem(self),
+            AISystem(self),
+            MovementSystem(self),
+            CollisionSystem(self),
+            AudioSystem(self),
+            RenderSystem(self),
+            PrepSystem(self),
+        ])
+
         # Inicializa a primeira fase
         self.spawn_phase_entities()
 
@@ -101,25 +168,11 @@ class Game:
     # -----------------------------------------------------------
     # HELPERS DO JOGO
     # -----------------------------------------------------------
-    def random_pos_away_from_player(self, margin, min_distance=150):
-        px, py = self.spawn_x, self.spawn_y
-
-        while True:
-            left = BORDER_THICKNESS + margin
-            right = WIDTH - BORDER_THICKNESS - margin
-            top = TOP_BORDER_THICKNESS + margin
-            bottom = HEIGHT - BORDER_THICKNESS - margin
-
-            x = random.randint(int(left), int(right))
-            y = random.randint(int(top), int(bottom))
-
-            if dist((x, y), (px, py)) >= min_distance:
-                return x, y
-
     def respawn_player(self):
         self.player.x = self.spawn_x
         self.player.y = self.spawn_y
         self.player.rect.center = (self.spawn_x, self.spawn_y)
+        self.player.dirty = 1
 
     def reset_phase(self):
         """Reinicia a fase atual sem alterar nº da fase, vidas ou pontuação total."""
@@ -140,43 +193,80 @@ class Game:
         self.n_npcs = 11
         self.reset_phase()
 
-    def spawn_phase_entities(self):
+    def phase_counts(self, n_npcs):
+        """Quantas entidades de cada tipo uma fase com `n_npcs` NPCs tem."""
+        dogs = n_npcs // 3
+        blacks = n_npcs // 3
+        oranges = n_npcs - dogs - blacks
+        return {Chicken: self.base_chickens, DobermannNPC: dogs,
+                BlackCatNPC: blacks, OrangeCatNPC: oranges}
+
+    def spawn_requests(self, counts):
+        # Margem da cerca por tipo. Galinhas primeiro: com a arena lotada
+        # são as últimas que sobrepõem alguém
+        return [(counts[Chicken], 40), (counts[DobermannNPC], 80),
+                (counts[BlackCatNPC], 60), (counts[OrangeCatNPC], 60)]
+
+    def spawn_phase_entities(self, prepared=None):
+        """Monta a fase. `prepared` é o (layout, campo de fluxo) calculado em
+        segundo plano pelo PhasePreparer; sem ele tudo é feito aqui."""
         self.all_sprites.empty()
         self.chickens.empty()
+        self.npcs.empty()
 
         # Player primeiro
         self.all_sprites.add(self.player)
 
-        dogs = self.n_npcs // 3
-        blacks = self.n_npcs // 3
-        oranges = self.n_npcs - dogs - blacks
+        if prepared is not None:
+            layout, flow_field = prepared
+            self.spare_flow_field, self.flow_field = self.flow_field, flow_field
+        else:
+            counts = self.phase_counts(self.n_npcs)
+            layout = self.spawn_planner.plan((self.spawn_x, self.spawn_y),
+                                             self.spawn_requests(counts))
+            self.flow_field.rebuild(self.flow_field.cell_of(self.player.x, self.player.y))
+        chicken_pos, dog_pos, black_pos, orange_pos = layout
+
+        npc_groups = [self.all_sprites, self.npcs]
 
         # Dobermanns
-        for _ in range(dogs):
-            x, y = self.random_pos_away_from_player(80)
-            npc = DobermannNPC(x, y, self.all_sprites)
+        for npc in self.pools[DobermannNPC].spawn(dog_pos, npc_groups):
             npc.player = self.player
+            npc.flow_field = self.flow_field
 
-        # Gatos pretos
-        for _ in range(blacks):
-            x, y = self.random_pos_away_from_player(60)
-            BlackCatNPC(x, y, self.all_sprites)
-
-        # Gatos laranjas
-        for _ in range(oranges):
-            x, y = self.random_pos_away_from_player(60)
-            OrangeCatNPC(x, y, self.all_sprites)
+        # Gatos pretos e laranjas
+        self.pools[BlackCatNPC].spawn(black_pos, npc_groups)
+        self.pools[OrangeCatNPC].spawn(orange_pos, npc_groups)
 
         # Galinhas
-        for _ in range(self.base_chickens):
-            x, y = self.random_pos_away_from_player(40)
-            Chicken(x, y, [self.all_sprites, self.chickens])
+        self.pools[Chicken].spawn(chicken_pos, [self.all_sprites, self.chickens])
 
         # Define os limites para todos os sprites
         for s in self.all_sprites:
             if hasattr(s, "set_bounds"):
                 s.set_bounds(self.bounds)
 
+        if self.crowd is not None:
+            self.crowd.rebuild(list(self.npcs) + list(self.chickens), self.player,
+                               self.flow_field)
+
+        self.rebuild_grids()
+        self.full_redraw = True
+        self.prepare_next_phase()
+
+    def prepare_next_phase(self):
+        """Agenda o layout e o BFS da fase seguinte (next_phase soma 3 NPCs)."""
+        counts = self.phase_counts(self.n_npcs + 3)
+        self.preparer.submit((self.phase + 1, self.n_npcs + 3),
+                             (self.spawn_x, self.spawn_y),
+                             self.spawn_requests(counts),
+                             self.spare_flow_field, counts)
+
+    def rebuild_grids(self):
+        """Atualiza as grades espaciais com as posições atuais dos sprites."""
+        self.npc_grid.rebuild(self.npcs)
+        self.chicken_grid.rebuild(self.chickens)
+
     def next_phase(self):
         self.total_score += self.phase_score  # agrega pontos ganhos
         self.phase_score = 0
@@ -185,7 +275,7 @@ class Game:
         self.n_npcs += 3
 
         self.respawn_player()
-        self.spawn_phase_entities()
+        self.spawn_phase_entities(self.preparer.take((self.phase, self.n_npcs)))
 
         self.waiting_phase_start = True
         self.phase_timer = self.phase_delay
@@ -199,26 +289,24 @@ class Game:
 
         px, py = self.player.x, self.player.y
 
-        for ent in list(self.all_sprites):
-            if ent is self.player or ent in self.chickens:
-                continue
-
-            d = dist((px, py), (ent.x, ent.y))
-            if d <= 150:
-                dx = ent.x - px
-                dy = ent.y - py
-                mag = max(1, (dx*dx + dy*dy)**0.5)
+        for ent in self.npc_grid.query_radius(px, py, 150):
+            dx = ent.x - px
+            dy = ent.y - py
+            mag = max(1, (dx*dx + dy*dy)**0.5)
 
-                new_x = ent.x + (dx / mag) * 150
-                new_y = ent.y + (dy / mag) * 150
+            new_x = ent.x + (dx / mag) * 150
+            new_y = ent.y + (dy / mag) * 150
 
-                bx, by, bw, bh = self.bounds
-                new_x = max(bx, min(new_x, bx + bw))
-                new_y = max(by, min(new_y, by + bh))
+            bx, by, bw, bh = self.bounds
+            new_x = max(bx, min(new_x, bx + bw))
+            new_y = max(by, min(new_y, by + bh))
 
-                ent.x = new_x
-                ent.y = new_y
-                ent.rect.center = (ent.x, ent.y)
+            ent.x = new_x
+            ent.y = new_y
+            ent.rect.center = (ent.x, ent.y)
+            ent.dirty = 1
+            if self.crowd is not None:
+                self.crowd.sync_sprite(ent)
 
     def check_cat_proximity_sound(self, dt):
         """Verifica se há algum gato perto para tocar o Hiss"""
@@ -231,12 +319,10 @@ class Game:
         px, py = self.player.x, self.player.y
         cat_nearby = False
 
-        for entity in self.all_sprites:
+        for entity in self.npc_grid.query_radius(px, py, 60):
             if isinstance(entity, BlackCatNPC) or isinstance(entity, OrangeCatNPC):
-                d = dist((px, py), (entity.x, entity.y))
-                if d < 60:
-                    cat_nearby = True
-                    break 
+                cat_nearby = True
+                break 
         
         if cat_nearby:
             self.sound_manager.play_hiss()
@@ -244,15 +330,18 @@ class Game:
 
     def handle_chicken_collisions(self):
         for chicken in list(self.chickens):
-            for entity in self.all_sprites:
-                if entity is chicken:
-                    continue
+            # O player tem prioridade: se ele encostou, a galinha vale pontos
+            if self.player.rect.colliderect(chicken.rect):
+                self.phase_score += 1000
+                chicken.kill()
+                continue
 
-                if entity.rect.colliderect(chicken.rect):
-                    if isinstance(entity, Player):
-                        self.phase_score += 1000
-                    chicken.kill()
-                    break
+            others = self.npc_grid.query_rect(chicken.rect)
+            if not others:
+                others = [c for c in self.chicken_grid.query_rect(chicken.rect)
+                          if c is not chicken]
+            if others:
+                chicken.kill()
 
         if len(self.chickens) == 0:
             self.next_phase()
@@ -261,30 +350,62 @@ class Game:
         if self.waiting_phase_start:
             return
 
-        for entity in self.all_sprites:
-            if entity is self.player or entity in self.chickens:
-                continue
-
-            if entity.rect.colliderect(self.player.rect):
+        if self.npc_grid.query_rect(self.player.rect):
 
-                if not self.player.is_hurt:
-                    self.player.hurt()
-                    self.lives -= 1
-                    self.sound_manager.play_hurt()
+            if not self.player.is_hurt:
+                self.player.hurt()
+                self.lives -= 1
+                self.sound_manager.play_hurt()
 
-                if self.lives <= 0:
-                    self.game_over = True
-                else:
-                    self.reset_phase() 
-                return
+            if self.lives <= 0:
+                self.game_over = True
+            else:
+                self.reset_phase() 
 
     # -----------------------------------------------------------
     # DESENHO NA TELA (UI)
     # -----------------------------------------------------------
     def draw_score(self):
         txt = f"{self.total_score + self.phase_score:06d} | Fase {self.phase} | Vidas: {self.lives}"
-        surf = self.font.render(txt, True, WHITE)
-        self.screen.blit(surf, (12, 6))
+        surf = text_cache.render(self.font, txt, WHITE)
+        return self.screen.blit(surf, (12, 6))
+
+    def draw_play_screen(self, message=None):
+        """Desenha a fase. No modo de retângulos sujos só atualiza na tela o
+        que mudou: sprites que se moveram e o HUD."""
+        full = self.full_redraw or not self.dirty_rendering
+        if full:
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+        else:
+            # Apaga o HUD anterior (sprites embaixo dele são redesenhados)
+            for r in self.hud_rects:
+                self.all_sprites.repaint_rect(r)
+
+        rects = self.all_sprites.draw(self.screen, self.play_background)
+
+        self.hud_rects = [self.draw_score()]
+        if message is not None:
+            msg = text_cache.render(self.font, message, (255,255,0))
+            rect = msg.get_rect(center=(WIDTH//2, HEIGHT//2))
+            self.hud_rects.append(self.screen.blit(msg, rect))
+
+        if full:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(rects + self.hud_rects)
+
+    def report_startup(self):
+        first_frame = (time.perf_counter() - self.started) * 1000
+        self.started = None
+        mode = "em segundo plano" if ASYNC_AUDIO_LOADING else "bloqueante"
+        print(f"[Startup] primeiro frame em {first_frame:.1f} ms (áudio {mode})")
+
+    def toggle_dirty_rendering(self):
+        self.dirty_rendering = not self.dirty_rendering
+        self.full_redraw = True
+        mode = "retângulos sujos" if self.dirty_rendering else "redesenho total"
+        print(f"[Render] {mode} | {self.clock.get_fps():.1f} FPS")
 
     def show_game_over(self):
         # Desenha o fundo antes do texto de Game Over
@@ -293,12 +414,12 @@ class Game:
         else:
             self.screen.fill(BACKGROUND_COLOR)
             
-        text = self.big_font.render("GAME OVER", True, (255, 80, 80))
+        text = text_cache.render(self.big_font, "GAME OVER", (255, 80, 80))
         rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
         self.screen.blit(text, rect)
         
         # Pequena instrução para voltar ao menu
-        subtext = self.font.render("Pressione ESC para o Menu", True, WHITE)
+        subtext = text_cache.render(self.font, "Pressione ESC para o Menu", WHITE)
         subrect = subtext.get_rect(center=(WIDTH//2, HEIGHT//2 + 60))
         self.screen.blit(subtext, subrect)
 
@@ -340,9 +461,9 @@ class Game:
             self.screen.fill(BACKGROUND_COLOR)
 
         # 2. Título do Jogo
-        title_surf = self.title_font.render("Caramel Adventures", True, (255, 165, 0)) # Laranja Caramelo
+        title_surf = text_cache.render(self.title_font, "Caramel Adventures", (255, 165, 0)) # Laranja Caramelo
         # Adiciona uma sombra simples ao título para destacar do fundo
-        title_shadow = self.title_font.render("Caramel Adventures", True, BLACK)
+        title_shadow = text_cache.render(self.title_font, "Caramel Adventures", BLACK)
         title_rect = title_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 150))
         self.screen.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
         self.screen.blit(title_surf, title_rect)
@@ -357,22 +478,22 @@ class Game:
         pygame.draw.rect(self.screen, color, self.play_button, border_radius=12)
         pygame.draw.rect(self.screen, WHITE, self.play_button, 2, border_radius=12) # Borda branca
 
-        play_text = self.big_font.render("JOGAR", True, WHITE)
+        play_text = text_cache.render(self.big_font, "JOGAR", WHITE)
         play_rect = play_text.get_rect(center=self.play_button.center)
         self.screen.blit(play_text, play_rect)
 
         # 5. Créditos (Nomes) com sombra para leitura
         credits_text = "Criado por: Ranielly Barroso & Luiza Batista"
-        credits_surf = self.font.render(credits_text, True, WHITE)
-        credits_shadow = self.font.render(credits_text, True, BLACK)
+        credits_surf = text_cache.render(self.font, credits_text, WHITE)
+        credits_shadow = text_cache.render(self.font, credits_text, BLACK)
         credits_rect = credits_surf.get_rect(center=(WIDTH//2, HEIGHT - 80))
         self.screen.blit(credits_shadow, (credits_rect.x+1, credits_rect.y+1))
         self.screen.blit(credits_surf, credits_rect)
 
         # 6. Universidade com sombra
         uni_text = "EST - UEA"
-        uni_surf = self.font.render(uni_text, True, (200, 200, 200))
-        uni_shadow = self.font.render(uni_text, True, BLACK)
+        uni_surf = text_cache.render(self.font, uni_text, (200, 200, 200))
+        uni_shadow = text_cache.render(self.font, uni_text, BLACK)
         uni_rect = uni_surf.get_rect(center=(WIDTH//2, HEIGHT - 40))
         self.screen.blit(uni_shadow, (uni_rect.x+1, uni_rect.y+1))
         self.screen.blit(uni_surf, uni_rect)
@@ -385,14 +506,16 @@ class Game:
     def run(self):
         while self.running:
             dt = self.clock.tick(FPS) / 1000
-            self.sound_manager.update()
 
             # ==================================================
             # ESTADO: MENU
             # ==================================================
             if self.in_menu:
+                self.sound_manager.update()
                 self.update_menu_animation(dt)
                 self.draw_menu()
+                if self.started is not None:
+                    self.report_startup()
 
                 for event in pygame.event.get():
                     if event.type == pygame.QUIT:
@@ -423,6 +546,12 @@ class Game:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.in_menu = True
 
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.toggle_dirty_rendering()
+
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                    print(self.systems.report())
+
                 if not self.waiting_phase_start and event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_SPACE:
                         self.player.bark()
@@ -430,51 +559,22 @@ class Game:
 
             # --- Tela de Espera entre Fases ---
             if self.waiting_phase_start:
+                self.sound_manager.update()
+                self.preparer.warm()
                 self.phase_timer -= dt
 
-                # Desenha o fundo
-                if self.has_background:
-                    self.screen.blit(self.background, (0, 0))
-                else:
-                    self.screen.fill(BACKGROUND_COLOR)
-
-                # Desenha a cerca e os sprites estáticos
-                pygame.draw.rect(self.screen, WHITE, self.bounds, 2)
-                for s in self.all_sprites:
-                    self.screen.blit(s.image, s.rect)
-
-                # Mensagem de contagem regressiva
-                msg = self.font.render(
-                    f"Fase {self.phase} começa em {int(self.phase_timer)+1}",
-                    True, (255,255,0)
+                # Sprites parados: só a mensagem de contagem regressiva muda
+                self.draw_play_screen(
+                    f"Fase {self.phase} começa em {int(self.phase_timer)+1}"
                 )
-                rect = msg.get_rect(center=(WIDTH//2, HEIGHT//2))
-                self.screen.blit(msg, rect)
-
-                self.draw_score()
-                pygame.display.flip()
 
                 if self.phase_timer <= 0:
                     self.waiting_phase_start = False
                 continue
 
             # --- Gameplay Real (Sprites se mexendo) ---
-            self.apply_bark_knockback()
-            self.all_sprites.update(dt)
-            self.check_cat_proximity_sound(dt)
-            self.handle_chicken_collisions()
-            self.handle_player_entity_collisions()
-
-            # Desenha o fundo
-            if self.has_background:
-                self.screen.blit(self.background, (0, 0))
-            else:
-                self.screen.fill(BACKGROUND_COLOR)
-
-            # Desenha a cerca, score e sprites
-            pygame.draw.rect(self.screen, WHITE, self.bounds, 2)
-            self.draw_score()
-            self.all_sprites.draw(self.screen)
-            pygame.display.flip()
+            # input → IA → movimento → colisão → áudio → desenho
+            self.systems.update(dt)
 
+        self.preparer.shutdown()
         pygame.quit()
\ No newline at end of file
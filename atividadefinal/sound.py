@@ -1,8 +1,37 @@
 import pygame
 import os
 import random
+import heapq
+import threading
 import time
 
+from config import ASYNC_AUDIO_LOADING
+
+# Prioridade das vozes: sons do jogador nunca ficam sem canal; o ambiente
+# (latidos e miados dos NPCs) é descartado quando o mixer está cheio
+PRIORITY_HIGH = 1
+PRIORITY_LOW = 0
+
+
+class SoundHandle:
+    """Lugar de um pygame.mixer.Sound que ainda pode estar carregando.
+    Enquanto `sound` for None, tocar não faz nada."""
+
+    def __init__(self, path, volume):
+        self.path = path
+        self.volume = volume
+        self.sound = None
+
+    def load(self):
+        try:
+            sound = pygame.mixer.Sound(self.path)
+        except Exception as e:
+            print(f"[Audio] Erro ao carregar SFX {os.path.basename(self.path)}: {e}")
+            return
+        sound.set_volume(self.volume)
+        self.sound = sound
+
+
 class SoundManager:
     def __init__(self):
         # Inicializa o mixer
@@ -46,6 +75,8 @@ class SoundManager:
         self.npc_meow_filenames = ["blackcatMeow.mp3", "orangecatMeow.mp3"]
 
         # --- CARREGAMENTO DE EFEITOS SONOROS (SFX) ---
+        # load_sound só cria o handle; a decodificação vem depois (thread)
+        self.handles = []
         self.player_bark_sound = self.load_sound(self.player_bark_file, self.vol_player_bark)
         self.player_hurt_sound = self.load_sound(self.player_hurt_file, self.vol_player_hurt)
         self.hiss_sound        = self.load_sound(self.hiss_file, self.vol_hiss)
@@ -61,35 +92,76 @@ class SoundManager:
             snd = self.load_sound(name, self.vol_npc_meow)
             if snd: self.npc_meows.append(snd)
 
+        # Decodifica os MP3 fora da thread principal: o menu aparece na hora
+        # e cada som começa a tocar assim que fica pronto
+        self.load_started = time.perf_counter()
+        self.load_time = None
+        if ASYNC_AUDIO_LOADING:
+            threading.Thread(target=self.load_all, daemon=True).start()
+        else:
+            self.load_all()
+
+        # --- CANAIS (ORÇAMENTO DE VOZES) ---
+        # Os primeiros canais ficam reservados para os sons do jogador
+        # (a escolha de canal é feita aqui, find_channel ignora a reserva);
+        # o ambiente usa no máximo AMBIENT_VOICES dos demais
+        self.RESERVED_VOICES = 3
+        self.AMBIENT_VOICES = 3
+        pygame.mixer.set_reserved(self.RESERVED_VOICES)
+        n = pygame.mixer.get_num_channels()
+        self.reserved_channels = [pygame.mixer.Channel(i) for i in range(self.RESERVED_VOICES)]
+        self.free_channels = [pygame.mixer.Channel(i) for i in range(self.RESERVED_VOICES, n)]
+        self.dropped_voices = 0
+        self.steal_index = 0
+        # Índices (em free_channels) dos canais cujo último som foi do ambiente
+        self.ambient_playing = set()
+
         # --- INICIA A MÚSICA DE FUNDO ---
         self.play_background_music()
 
-        # --- TIMERS ---
-        self.last_bark_time = time.time()
-        self.last_meow_time = time.time()
-        
+        # --- AGENDA DO AMBIENTE ---
+        # Heap de (instante em ms, seq, nome); update() só olha o topo
         self.BARK_INTERVAL = 5.0
         self.MEOW_INTERVAL = 5.0
+        self.AMBIENT_JITTER = 0.3  # ±30% no intervalo para não soar mecânico
+
+        self.ambient = {
+            "bark": (self.BARK_INTERVAL, self.play_random_npc_bark),
+            "meow": (self.MEOW_INTERVAL, self.play_random_npc_meow),
+        }
+        self.schedule = []
+        self.schedule_seq = 0
+        now = pygame.time.get_ticks()
+        for name in self.ambient:
+            self.schedule_ambient(name, now)
 
     def load_sound(self, filename, volume=1.0):
-        """Carrega efeitos sonoros curtos (SFX)."""
+        """Cria o handle de um efeito sonoro curto (SFX); quem decodifica é
+        load_all."""
         if not self.sound_enabled:
             return None
         
         full_path = os.path.join(self.sound_dir, filename)
 
         if os.path.exists(full_path):
-            try:
-                sound = pygame.mixer.Sound(full_path)
-                sound.set_volume(volume)
-                return sound
-            except Exception as e:
-                print(f"[Audio] Erro ao carregar SFX {filename}: {e}")
-                return None
+            handle = SoundHandle(full_path, volume)
+            self.handles.append(handle)
+            return handle
         else:
             print(f"[Audio] Arquivo SFX NÃO encontrado: {filename}")
             return None
 
+    def load_all(self):
+        """Decodifica todos os SFX (roda na thread de carregamento)."""
+        for handle in self.handles:
+            handle.load()
+        self.load_time = time.perf_counter() - self.load_started
+        loaded = sum(h.sound is not None for h in self.handles)
+        failed = len(self.handles) - loaded
+        falhas = f", {failed} com erro" if failed else ""
+        print(f"[Audio] {loaded}/{len(self.handles)} SFX prontos em "
+              f"{self.load_time * 1000:.1f} ms{falhas}")
+
     def play_background_music(self):
         """Carrega e toca a música de fundo em loop (Stream)."""
         if not self.sound_enabled:
@@ -110,41 +182,86 @@ class SoundManager:
         else:
             print(f"[Audio] Arquivo de Música NÃO encontrado: {full_path}")
 
+    def schedule_ambient(self, name, now):
+        """Agenda o próximo disparo do som ambiente `name` (com jitter)."""
+        interval, _ = self.ambient[name]
+        jitter = random.uniform(1 - self.AMBIENT_JITTER, 1 + self.AMBIENT_JITTER)
+        self.schedule_seq += 1
+        heapq.heappush(self.schedule, (now + interval * jitter * 1000, self.schedule_seq, name))
+
     def update(self):
-        """Chamado a cada frame no Game loop para checar os timers automáticos"""
+        """Chamado a cada frame no Game loop. Sem nada vencido, custa uma
+        comparação com o topo da agenda."""
         if not self.sound_enabled:
             return
 
-        current_time = time.time()
+        now = pygame.time.get_ticks()
+        while self.schedule and self.schedule[0][0] <= now:
+            _, _, name = heapq.heappop(self.schedule)
+            self.ambient[name][1]()
+            # Reagenda a partir de agora: depois de uma pausa (game over)
+            # não sai uma rajada de sons atrasados
+            self.schedule_ambient(name, now)
 
-        if current_time - self.last_bark_time >= self.BARK_INTERVAL:
-            self.play_random_npc_bark()
-            self.last_bark_time = current_time
+    def play(self, sound, priority=PRIORITY_LOW):
+        """Toca respeitando o orçamento de vozes. Sons de alta prioridade
+        usam os canais reservados e, se todos estiverem ocupados, um canal
+        livre ou (em último caso) um que esteja tocando ambiente; se nem
+        isso houver, o som é descartado. Os de baixa prioridade são
+        descartados quando o ambiente já usa AMBIENT_VOICES canais."""
+        if not sound or sound.sound is None:
+            return  # arquivo ausente ou ainda carregando
+        sound = sound.sound
 
-        if current_time - self.last_meow_time >= self.MEOW_INTERVAL:
-            self.play_random_npc_meow()
-            self.last_meow_time = current_time
+        if priority == PRIORITY_HIGH:
+            for channel in self.reserved_channels:
+                if not channel.get_busy():
+                    channel.play(sound)
+                    return
+            for i, channel in enumerate(self.free_channels):
+                if not channel.get_busy():
+                    channel.play(sound)
+                    self.ambient_playing.discard(i)
+                    return
+            # Tudo ocupado: interrompe um canal do ambiente (em rodízio),
+            # nunca outro som de alta prioridade
+            if not self.ambient_playing:
+                self.dropped_voices += 1
+                return
+            later = [i for i in self.ambient_playing if i > self.steal_index]
+            self.steal_index = min(later or self.ambient_playing)
+            self.free_channels[self.steal_index].play(sound)
+            self.ambient_playing.discard(self.steal_index)
+            return
+
+        busy = 0
+        idle = None
+        for i, channel in enumerate(self.free_channels):
+            if channel.get_busy():
+                busy += 1
+            elif idle is None:
+                idle = i
+        if busy >= self.AMBIENT_VOICES or idle is None:
+            self.dropped_voices += 1
+            return
+        self.free_channels[idle].play(sound)
+        self.ambient_playing.add(idle)
 
     # --- MÉTODOS DE DISPARO ---
 
     def play_player_bark(self):
-        if self.player_bark_sound:
-            self.player_bark_sound.play()
+        self.play(self.player_bark_sound, PRIORITY_HIGH)
 
     def play_hurt(self):
-        if self.player_hurt_sound:
-            self.player_hurt_sound.play()
+        self.play(self.player_hurt_sound, PRIORITY_HIGH)
 
     def play_hiss(self):
-        if self.hiss_sound:
-            self.hiss_sound.play()
+        self.play(self.hiss_sound, PRIORITY_HIGH)
 
     def play_random_npc_bark(self):
         if self.npc_barks:
-            sound = random.choice(self.npc_barks)
-            sound.play()
+            self.play(random.choice(self.npc_barks))
 
     def play_random_npc_meow(self):
         if self.npc_meows:
-            sound = random.choice(self.npc_meows)
-            sound.play()
\ No newline at end of file
+            self.play(random.choice(self.npc_meows))
\ No newline at end of file
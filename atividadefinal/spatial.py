@@ -0,0 +1,61 @@
+import pygame
+from collections import defaultdict
+from math import dist
+
+
+class SpatialHash:
+    """Grade uniforme para consultas de colisão e proximidade.
+
+    Cada sprite é registrado em todas as células que o seu rect toca, então
+    uma consulta só examina os sprites das células vizinhas em vez de
+    percorrer o grupo inteiro.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, sprite):
+        for key in self.cells_for(sprite.rect):
+            self.cells[key].append(sprite)
+
+    def rebuild(self, sprites):
+        """Reconstrói a grade com as posições atuais dos sprites."""
+        self.cells.clear()
+        for s in sprites:
+            self.insert(s)
+
+    def cells_for(self, rect):
+        cs = self.cell_size
+        x0 = int(rect.left // cs)
+        x1 = int((rect.right - 1) // cs)
+        y0 = int(rect.top // cs)
+        y1 = int((rect.bottom - 1) // cs)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield cx, cy
+
+    def candidates(self, rect):
+        """Sprites das células tocadas pelo rect, sem repetição."""
+        seen = set()
+        found = []
+        for key in self.cells_for(rect):
+            for s in self.cells.get(key, ()):
+                if s not in seen:
+                    seen.add(s)
+                    found.append(s)
+        return found
+
+    def query_rect(self, rect):
+        """Sprites vivos cujo rect colide com o rect dado."""
+        return [s for s in self.candidates(rect)
+                if s.alive() and s.rect.colliderect(rect)]
+
+    def query_radius(self, x, y, radius):
+        """Sprites vivos cujo centro (x, y) está a no máximo `radius` do ponto."""
+        area = pygame.Rect(x - radius, y - radius, 2 * radius + 1, 2 * radius + 1)
+        return [s for s in self.candidates(area)
+                if s.alive() and dist((x, y), (s.x, s.y)) <= radius]
@@ -0,0 +1,174 @@
+import random
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SpawnPlanner:
+    """Planeja todas as posições de spawn de uma fase de uma vez.
+
+    Usa amostragem de disco de Poisson por lançamento de dardos: cada ponto
+    fica a pelo menos `spacing` dos já escolhidos e a `min_distance` do
+    player. Cada ponto tem no máximo `attempts` tentativas; se todas falham
+    (arena lotada), fica com a tentativa mais afastada dos vizinhos. Assim o
+    custo é limitado a pontos × tentativas, sem `while True`.
+    """
+
+    def __init__(self, bounds, spacing, min_distance=150, attempts=30, rng=random):
+        self.bounds = bounds
+        self.spacing = spacing
+        self.min_distance = min_distance
+        self.attempts = attempts
+        self.rng = rng
+
+    def plan(self, origin, requests):
+        """`requests` é uma lista de (quantidade, margem da cerca).
+        Devolve uma lista de posições (x, y) para cada pedido, na mesma ordem."""
+        cells = defaultdict(list)
+        result = []
+        for count, margin in requests:
+            placed = []
+            for _ in range(count):
+                x, y = self._sample(cells, origin, margin)
+                cells[self._cell(x, y)].append((x, y))
+                placed.append((x, y))
+            result.append(placed)
+        return result
+
+    def _cell(self, x, y):
+        return int(x // self.spacing), int(y // self.spacing)
+
+    def _nearest_sq(self, cells, x, y):
+        """Distância² até o ponto mais próximo nas 9 células vizinhas."""
+        cx, cy = self._cell(x, y)
+        best = float("inf")
+        for i in range(cx - 1, cx + 2):
+            for j in range(cy - 1, cy + 2):
+                for px, py in cells.get((i, j), ()):
+                    d = (px - x) ** 2 + (py - y) ** 2
+                    if d < best:
+                        best = d
+        return best
+
+    def _sample(self, cells, origin, margin):
+        bx, by, bw, bh = self.bounds
+        left, right = bx + margin, bx + bw - margin
+        top, bottom = by + margin, by + bh - margin
+        if right < left:
+            left = right = bx + bw / 2
+        if bottom < top:
+            top = bottom = by + bh / 2
+
+        ox, oy = origin
+        spacing_sq = self.spacing ** 2
+        min_dist_sq = self.min_distance ** 2
+
+        best, best_score = None, -1.0
+        for _ in range(self.attempts):
+            x = self.rng.uniform(left, right)
+            y = self.rng.uniform(top, bottom)
+            near = self._nearest_sq(cells, x, y)
+            away = (x - ox) ** 2 + (y - oy) ** 2 >= min_dist_sq
+            if away and near >= spacing_sq:
+                return x, y
+
+            # Reserva: perto do player é a pior opção possível
+            score = near if away else -0.5
+            if score > best_score:
+                best, best_score = (x, y), score
+        return best
+
+
+class EntityPool:
+    """Instâncias de um tipo de entidade reaproveitadas entre fases.
+
+    A cada spawn todas voltam ao início da lista: as que já existem são
+    reiniciadas com reset(x, y) e só se cria objeto novo quando a fase
+    pede mais do que o pool já tem.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.items = []
+        self.reused = 0
+
+    def spawn(self, positions, groups):
+        """Coloca uma entidade em cada posição e devolve a lista usada."""
+        used = []
+        for i, (x, y) in enumerate(positions):
+            if i < len(self.items):
+                ent = self.items[i]
+                ent.reset(x, y)
+                ent.add(groups)
+                self.reused += 1
+            else:
+                ent = self.cls(x, y, groups)
+                self.items.append(ent)
+            used.append(ent)
+        return used
+
+    def prewarm(self, count, budget):
+        """Cria (fora dos grupos) até `budget` instâncias para o pool chegar
+        a `count`. Devolve quantas criou."""
+        made = 0
+        while len(self.items) < count and made < budget:
+            self.items.append(self.cls(0, 0, ()))
+            made += 1
+        return made
+
+    def stats(self):
+        return f"{self.cls.__name__}: {len(self.items)} criadas, {self.reused} reusos"
+
+
+class PhasePreparer:
+    """Prepara a próxima fase enquanto a atual está rodando.
+
+    O trabalho em Python puro (posições de spawn e BFS do campo de fluxo) vai
+    para uma thread; criar entidades mexe com Surfaces e fica na thread
+    principal, poucas por frame (warm). No fim da fase, take() entrega o
+    resultado pronto.
+    """
+
+    def __init__(self, planner, pools):
+        self.planner = planner
+        self.pools = pools
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.future = None
+        self.key = None
+        self.needed = {}
+
+    def submit(self, key, origin, requests, flow_field, needed):
+        """Agenda o plano da fase `key`. `flow_field` é um campo reserva que
+        só a thread toca até take(); `needed` é {classe: quantidade}."""
+        # rng próprio (semeado daqui) para a thread não disputar o `random`
+        planner = SpawnPlanner(self.planner.bounds, self.planner.spacing,
+                               self.planner.min_distance, self.planner.attempts,
+                               random.Random(random.getrandbits(32)))
+        self.future = self.executor.submit(self._work, planner, origin, requests, flow_field)
+        self.key = key
+        self.needed = needed
+
+    @staticmethod
+    def _work(planner, origin, requests, flow_field):
+        layout = planner.plan(origin, requests)
+        flow_field.rebuild(flow_field.cell_of(*origin))
+        return layout, flow_field
+
+    def warm(self, budget=2):
+        """Completa os pools para a próxima fase, no máximo `budget` por chamada."""
+        for cls, count in self.needed.items():
+            budget -= self.pools[cls].prewarm(count, budget)
+            if budget <= 0:
+                break
+
+    def take(self, key):
+        """(layout, campo de fluxo) da fase `key`, ou None se não foi ela a
+        preparada. Se a thread ainda não terminou, espera por ela."""
+        if self.future is None or self.key != key:
+            return None
+        result = self.future.result()
+        self.future = None
+        self.key = None
+        return result
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
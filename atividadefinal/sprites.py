@@ -2,6 +2,8 @@ import pygame
 import random
 from math import dist
 
+from atlas import TextureAtlas
+
 
 def load_spritesheet(image_path, frame_width, frame_height):
     sheet = pygame.image.load(image_path).convert_alpha()
@@ -17,22 +19,84 @@ def load_spritesheet(image_path, frame_width, frame_height):
     return frames
 
 
-def load_hurt_two_frames(path, frame_w, frame_h):
-    sheet = pygame.image.load(path).convert_alpha()
-    sw, sh = sheet.get_size()
+# =====================================================
+# ANIMAÇÕES
+# =====================================================
+class Animation:
+    """Frames de uma animação e suas cópias espelhadas, geradas uma vez na carga."""
+
+    def __init__(self, frames):
+        self.frames = tuple(frames)
+        self.flipped = tuple(pygame.transform.flip(f, True, False) for f in self.frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    def frame(self, index, facing_left=False):
+        if facing_left:
+            return self.flipped[index]
+        return self.frames[index]
+
+
+# =====================================================
+# CACHE DE SPRITESHEETS
+# =====================================================
+class SpriteSheetCache:
+    """Registro global de spritesheets.
+
+    Cada chave (caminho, frame_w, frame_h) é fatiada uma única vez; as
+    entidades recebem a mesma Animation compartilhada. Se o atlas foi gerado
+    (python atlas.py), os frames vêm dele; só as spritesheets que mudaram
+    depois do bake são lidas do PNG solto.
+    """
+
+    def __init__(self):
+        self.sheets = {}
+        self.hits = 0
+        self.misses = 0
+        self.atlas = None
+        self.atlas_checked = False
+
+    def load_frames(self, path, frame_w, frame_h):
+        if not self.atlas_checked:
+            self.atlas = TextureAtlas.load()
+            self.atlas_checked = True
+        if self.atlas is not None and path in self.atlas:
+            return self.atlas.frames(path, frame_w, frame_h)
+        return load_spritesheet(path, frame_w, frame_h)
+
+    def get(self, path, frame_w, frame_h):
+        key = (path, frame_w, frame_h)
+        frames = self.sheets.get(key)
+        if frames is None:
+            self.misses += 1
+            frames = Animation(self.load_frames(path, frame_w, frame_h))
+            self.sheets[key] = frames
+        else:
+            self.hits += 1
+        return frames
+
+    def stats(self):
+        return {"sheets": len(self.sheets), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        self.sheets.clear()
+        self.hits = 0
+        self.misses = 0
+        self.atlas = None
+        self.atlas_checked = False
 
-    frames = []
-    for x in range(0, sw, frame_w):
-        if x + frame_w <= sw:
-            frame = sheet.subsurface((x, 0, frame_w, frame_h)).copy()
-            frames.append(frame)
-    return frames
+
+sprite_cache = SpriteSheetCache()
 
 
 # =====================================================
 # CLASSE BASE
 # =====================================================
-class Entity(pygame.sprite.Sprite):
+class Entity(pygame.sprite.DirtySprite):
     def __init__(self, x, y, speed,
                  spritesheet_idle, spritesheet_walk,
                  frame_w, frame_h, groups):
@@ -47,8 +111,8 @@ class Entity(pygame.sprite.Sprite):
         self.frame_time = 0
         self.frame_speed = 0.09
 
-        self.anim_idle = load_spritesheet(spritesheet_idle, frame_w, frame_h)
-        self.anim_walk = load_spritesheet(spritesheet_walk, frame_w, frame_h)
+        self.anim_idle = sprite_cache.get(spritesheet_idle, frame_w, frame_h)
+        self.anim_walk = sprite_cache.get(spritesheet_walk, frame_w, frame_h)
 
         self.current_anim = self.anim_idle
 
@@ -70,6 +134,35 @@ class Entity(pygame.sprite.Sprite):
     def set_bounds(self, bounds):
         self.bounds = bounds
 
+    def reset(self, x, y):
+        """Volta ao estado de recém-criado em (x, y); usado pelo EntityPool."""
+        self.x = x
+        self.y = y
+        self.dx = 0
+        self.dy = 0
+        self.facing_left = False
+        self.current_anim = self.anim_idle
+        self.frame = 0
+        self.frame_time = 0
+        self.image = self.current_anim[0]
+        self.rect = self.image.get_rect(center=(x, y))
+        self.dirty = 1
+
+    def set_frame(self, image):
+        """Troca a imagem e recentraliza. Só marca o sprite como sujo se a
+        imagem ou o retângulo mudaram: sprite parado não é redesenhado."""
+        rect = image.get_rect(center=(self.x, self.y))
+        if image is not self.image or rect != self.rect:
+            self.image = image
+            self.rect = rect
+            self.dirty = 1
+
+    def set_center(self, x, y):
+        old = self.rect.center
+        self.rect.center = (x, y)
+        if self.rect.center != old:
+            self.dirty = 1
+
     def animate(self, dt):
         if len(self.current_anim) == 0:
             return
@@ -79,13 +172,7 @@ class Entity(pygame.sprite.Sprite):
             self.frame_time = 0
             self.frame = (self.frame + 1) % len(self.current_anim)
 
-        base = self.current_anim[self.frame]
-
-        if self.facing_left:
-            base = pygame.transform.flip(base, True, False)
-
-        self.image = base
-        self.rect = self.image.get_rect(center=(self.x, self.y))
+        self.set_frame(self.current_anim.frame(self.frame, self.facing_left))
 
     def move(self, dt):
         self.x += self.dx * self.speed * dt
@@ -98,9 +185,14 @@ class Entity(pygame.sprite.Sprite):
             if self.y < by: self.y = by
             if self.y > by + bh: self.y = by + bh
 
-        self.rect.center = (self.x, self.y)
+        self.set_center(self.x, self.y)
 
-    def update(self, dt):
+    def steer(self, dt):
+        """IA: escolhe dx/dy. As subclasses de NPC sobrescrevem."""
+        pass
+
+    def advance(self, dt):
+        """Aplica dx/dy: escolhe idle/walk, orientação, move e anima."""
         moving = self.dx != 0 or self.dy != 0
         if moving:
             self.set_anim(self.anim_walk)
@@ -113,6 +205,22 @@ class Entity(pygame.sprite.Sprite):
         self.move(dt)
         self.animate(dt)
 
+    def update(self, dt):
+        self.steer(dt)
+        self.advance(dt)
+
+    def sync_from_crowd(self, x, y, dx, dy, frame, facing_left):
+        """Modo multidão: posição, direção e frame da animação já foram
+        calculados em lote pelo CrowdSystem; aqui só copia para o sprite."""
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.facing_left = facing_left
+        self.current_anim = self.anim_walk if (dx != 0 or dy != 0) else self.anim_idle
+        self.frame = frame
+        self.set_frame(self.current_anim.frame(frame, facing_left))
+
 
 # =====================================================
 # PLAYER
@@ -132,8 +240,8 @@ class Player(Entity):
         self.manual_control = manual_control
 
         # ANIMAÇÕES ADICIONAIS
-        self.anim_hurt = load_hurt_two_frames("assets/sprites/caramel/Hurt.png", 48, 48)
-        self.anim_attack = load_spritesheet("assets/sprites/caramel/Attack.png", 48, 48)
+        self.anim_hurt = sprite_cache.get("assets/sprites/caramel/Hurt.png", 48, 48)
+        self.anim_attack = sprite_cache.get("assets/sprites/caramel/Attack.png", 48, 48)
 
         # ESTADOS
         self.is_hurt = False
@@ -147,6 +255,19 @@ class Player(Entity):
 
         self.score = 0
 
+        # Direção vinda do InputSystem (já normalizada)
+        self.input_dx = 0
+        self.input_dy = 0
+
+    def set_input(self, dx, dy):
+        # Normalização
+        if dx != 0 or dy != 0:
+            mag = max(1, (dx*dx + dy*dy)**0.5)
+            dx /= mag
+            dy /= mag
+        self.input_dx = dx
+        self.input_dy = dy
+
     # ============================================================
     # TOMAR DANO → HURT
     # ============================================================
@@ -206,17 +327,10 @@ class Player(Entity):
         # -----------------------
         # CONTROLE DO JOGADOR
         # -----------------------
-        # Só lê o teclado se o controle manual estiver ativado
+        # A leitura do teclado fica no InputSystem; aqui só usa a direção
         if self.manual_control:
-            keys = pygame.key.get_pressed()
-            self.dx = (keys[pygame.K_d] - keys[pygame.K_a])
-            self.dy = (keys[pygame.K_s] - keys[pygame.K_w])
-        
-            # Normalização
-            if self.dx != 0 or self.dy != 0:
-                mag = max(1, (self.dx*self.dx + self.dy*self.dy)**0.5)
-                self.dx /= mag
-                self.dy /= mag
+            self.dx = self.input_dx
+            self.dy = self.input_dy
 
             # HANDLING DA ORIENTAÇÃO
             if self.dx < 0:
@@ -248,21 +362,27 @@ class DobermannNPC(Entity):
             48, 48, groups)
 
         self.player = None
+        self.flow_field = None
         self.random_time = 0
 
-    def update(self, dt):
+    def steer(self, dt):
         if self.player is not None:
             px, py = self.player.x, self.player.y
-            dx = px - self.x
-            dy = py - self.y
-            d = max(1, (dx*dx + dy*dy)**0.5)
+            if self.flow_field is not None:
+                # Segue o campo de fluxo (contorna obstáculos)
+                self.dx, self.dy = self.flow_field.direction(self.x, self.y, px, py)
+            else:
+                dx = px - self.x
+                dy = py - self.y
+                d = max(1, (dx*dx + dy*dy)**0.5)
 
-            self.dx = dx / d
-            self.dy = dy / d
-        super().update(dt)
+                self.dx = dx / d
+                self.dy = dy / d
 
 
 class BlackCatNPC(Entity):
+    change_range = (0.5, 1.3)  # intervalo (s) entre trocas de direção
+
     def __init__(self, x, y, groups):
         super().__init__(x, y, 110,
             "assets/sprites/blackcat/Idle.png",
@@ -270,16 +390,21 @@ class BlackCatNPC(Entity):
             48, 48, groups)
         self.change_time = 0
 
-    def update(self, dt):
+    def reset(self, x, y):
+        super().reset(x, y)
+        self.change_time = 0
+
+    def steer(self, dt):
         self.change_time -= dt
         if self.change_time <= 0:
             self.dx = random.choice([-1, 0, 1])
             self.dy = random.choice([-1, 0, 1])
-            self.change_time = random.uniform(0.5, 1.3)
-        super().update(dt)
+            self.change_time = random.uniform(*self.change_range)
 
 
 class OrangeCatNPC(Entity):
+    change_range = (0.5, 1.3)
+
     def __init__(self, x, y, groups):
         super().__init__(x, y, 110,
             "assets/sprites/orangecat/Idle.png",
@@ -287,19 +412,24 @@ class OrangeCatNPC(Entity):
             48, 48, groups)
         self.change_time = 0
 
-    def update(self, dt):
+    def reset(self, x, y):
+        super().reset(x, y)
+        self.change_time = 0
+
+    def steer(self, dt):
         self.change_time -= dt
         if self.change_time <= 0:
             self.dx = random.choice([-1, 0, 1])
             self.dy = random.choice([-1, 0, 1])
-            self.change_time = random.uniform(0.5, 1.3)
-        super().update(dt)
+            self.change_time = random.uniform(*self.change_range)
 
 
 # =====================================================
 # GALINHA
 # =====================================================
 class Chicken(Entity):
+    change_range = (0.4, 1.0)
+
     def __init__(self, x, y, groups):
         super().__init__(
             x, y, 90,
@@ -309,11 +439,13 @@ class Chicken(Entity):
         )
         self.change_time = 0
 
-    def update(self, dt):
+    def reset(self, x, y):
+        super().reset(x, y)
+        self.change_time = 0
+
+    def steer(self, dt):
         self.change_time -= dt
         if self.change_time <= 0:
             self.dx = random.choice([-1, 0, 1])
             self.dy = random.choice([-1, 0, 1])
-            self.change_time = random.uniform(0.4, 1.0)
-
-        super().update(dt)
\ No newline at end of file
+            self.change_time = random.uniform(*self.change_range)
\ No newline at end of file
@@ -1,6 +1,165 @@
-class InputSystem:
+import time
+
+import pygame
+
+
+# =====================================================
+# SISTEMAS DO GAMEPLAY
+# =====================================================
+class System:
+    """Uma etapa do tick de gameplay. Cada sistema tem um nome (usado para
+    ligar/desligar e reordenar no agendador) e um update(dt)."""
+    name = "system"
+
     def __init__(self, game):
         self.game = game
+        self.enabled = True
 
-    def update(self):
+    def update(self, dt):
         pass
+
+
+class InputSystem(System):
+    """Lê o teclado uma vez por tick e entrega a direção ao player."""
+    name = "input"
+
+    def update(self, dt):
+        player = self.game.player
+        if not player.manual_control:
+            return
+        keys = pygame.key.get_pressed()
+        player.set_input(keys[pygame.K_d] - keys[pygame.K_a],
+                         keys[pygame.K_s] - keys[pygame.K_w])
+
+
+class AISystem(System):
+    """Decide para onde os NPCs vão (campo de fluxo, perseguição, passeio)."""
+    name = "ai"
+
+    def update(self, dt):
+        game = self.game
+        game.flow_field.update(dt, game.player.x, game.player.y)
+        if game.crowd is not None:
+            game.crowd.steer(dt)
+            return
+        for npc in game.npcs:
+            npc.steer(dt)
+        for chicken in game.chickens:
+            chicken.steer(dt)
+
+
+class MovementSystem(System):
+    """Empurrão do latido, depois move e anima player e NPCs."""
+    name = "movement"
+
+    def update(self, dt):
+        game = self.game
+        game.apply_bark_knockback()
+        game.player.update(dt)
+        if game.crowd is not None:
+            game.crowd.move(dt)
+            return
+        for npc in game.npcs:
+            npc.advance(dt)
+        for chicken in game.chickens:
+            chicken.advance(dt)
+
+
+class CollisionSystem(System):
+    """Reconstrói as grades e resolve galinhas e contato com o player."""
+    name = "collision"
+
+    def update(self, dt):
+        game = self.game
+        game.rebuild_grids()
+        game.handle_chicken_collisions()
+        game.handle_player_entity_collisions()
+
+
+class AudioSystem(System):
+    """Ambiente e o Hiss dos gatos por perto."""
+    name = "audio"
+
+    def update(self, dt):
+        game = self.game
+        game.sound_manager.update()
+        game.check_cat_proximity_sound(dt)
+
+
+class RenderSystem(System):
+    name = "render"
+
+    def update(self, dt):
+        self.game.draw_play_screen()
+
+
+class PrepSystem(System):
+    """Cria aos poucos as entidades que a próxima fase vai precisar."""
+    name = "prep"
+
+    def update(self, dt):
+        self.game.preparer.warm()
+
+
+# =====================================================
+# AGENDADOR
+# =====================================================
+class SystemScheduler:
+    """Roda os sistemas na ordem da lista e mede quanto cada um custa.
+
+    Sistemas podem ser desligados (enable/disable) ou reordenados pelo nome,
+    o que ajuda a isolar qual etapa está pesando no frame."""
+
+    def __init__(self, systems):
+        self.systems = list(systems)
+        self.timings = {}
+        self.reset_timings()
+
+    def get(self, name):
+        for system in self.systems:
+            if system.name == name:
+                return system
+        raise KeyError(f"Sistema desconhecido: {name}")
+
+    def enable(self, name, enabled=True):
+        self.get(name).enabled = enabled
+
+    def disable(self, name):
+        self.enable(name, False)
+
+    def reorder(self, names):
+        """Nova ordem pelos nomes; sistemas não citados vão para o fim."""
+        first = [self.get(n) for n in names]
+        self.systems = first + [s for s in self.systems if s not in first]
+
+    def order(self):
+        return [s.name for s in self.systems]
+
+    def update(self, dt):
+        timings = self.timings
+        for system in self.systems:
+            if not system.enabled:
+                continue
+            t0 = time.perf_counter()
+            system.update(dt)
+            elapsed = time.perf_counter() - t0
+
+            counter = timings[system.name]
+            counter[0] += elapsed
+            counter[1] += 1
+            if elapsed > counter[2]:
+                counter[2] = elapsed
+
+    def reset_timings(self):
+        # nome -> [tempo total, chamadas, pior tick] (segundos)
+        self.timings = {s.name: [0.0, 0, 0.0] for s in self.systems}
+
+    def report(self):
+        lines = []
+        for system in self.systems:
+            total, calls, worst = self.timings[system.name]
+            avg = total / calls * 1000 if calls else 0.0
+            state = "" if system.enabled else " (desligado)"
+            lines.append(f"{system.name:<10} média {avg:6.3f} ms | "
+                         f"pior {worst * 1000:6.3f} ms | {calls} ticks{state}")
+        return "\n".join(lines)
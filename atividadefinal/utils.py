@@ -1,8 +1,13 @@
 import pygame
 import os
+import sys
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Raiz do repositório no path, para os módulos compartilhados entre os jogos
+sys.path.append(os.path.dirname(BASE_DIR))
+from shared.text_cache import text_cache  # noqa: E402,F401
+
 def build_path(rel_path):
     return os.path.join(BASE_DIR, rel_path)
 
@@ -27,4 +32,4 @@ def load_spritesheet(path, frame_width, frame_height):
             frame = sheet.subsurface((x, y, frame_width, frame_height)).copy()
             frames.append(frame)
 
-    return frames
\ No newline at end of file
+    return frames
@@ -0,0 +1,3 @@
+# Code shared by the pygame games in this repository. Each game runs as a
+# standalone script, so it puts the repository root on sys.path and then
+# imports from here (see the top of each game's utils/main module).
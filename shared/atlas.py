@@ -0,0 +1,96 @@
+"""Build-step helpers for the games' texture atlases.
+
+The atlas image and its JSON index are generated ahead of time (python
+atlas.py in each game folder). Each index records a fingerprint of every
+source image, so a loader can tell when a source changed after the bake.
+"""
+import hashlib
+import os
+
+import pygame
+
+
+def pack_shelves(sizes, max_width, padding=1):
+    """Pack rectangles on shelves, tallest first. Returns the positions in
+    the order of `sizes` and the final atlas size."""
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelf_h = used_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if x > 0 and x + w > max_width:
+            y += shelf_h + padding
+            x = shelf_h = 0
+        positions[i] = (x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x - padding)
+    return positions, (used_w, y + shelf_h)
+
+
+def to_palette(image):
+    """8-bit copy of the image if it has at most 255 colors and alpha only
+    0 or 255 (pixel art). Returns (image, transparent color), or
+    (image, None) unchanged when it doesn't fit.
+
+    Index 0 is the transparent color, one no pixel uses. PNG doesn't keep
+    a colorkey, so the caller stores it next to the image. Pixels are
+    copied one by one: SDL's blit to 8 bits approximates colors.
+    """
+    pixels = pygame.PixelArray(image)
+    w, h = image.get_size()
+    colors = {}
+    for x in range(w):
+        column = pixels[x]
+        for y in range(h):
+            r, g, b, a = image.unmap_rgb(column[y])
+            if a not in (0, 255):
+                pixels.close()
+                return image, None
+            if a and (r, g, b) not in colors:
+                if len(colors) == 255:
+                    pixels.close()
+                    return image, None
+                colors[(r, g, b)] = len(colors) + 1
+
+    key = next(c for c in ((255, 0, 255), (0, 255, 255), (1, 2, 3)) if c not in colors)
+    palette = [key] + list(colors)
+    out = pygame.Surface((w, h), depth=8)
+    out.set_palette(palette + [(0, 0, 0)] * (256 - len(palette)))
+    out_pixels = pygame.PixelArray(out)
+    for x in range(w):
+        column = pixels[x]
+        out_column = out_pixels[x]
+        for y in range(h):
+            r, g, b, a = image.unmap_rgb(column[y])
+            out_column[y] = colors[(r, g, b)] if a else 0
+    pixels.close()
+    out_pixels.close()
+    return out, key
+
+
+def _sha1(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def fingerprint(path):
+    """Size, mtime and SHA-1 of a source file, as stored in the index."""
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime": st.st_mtime_ns, "sha1": _sha1(path)}
+
+
+def is_fresh(path, recorded):
+    """True if the file still matches the fingerprint taken at bake time.
+
+    Same size and mtime is trusted without reading the file. A different
+    mtime alone (a fresh git checkout) falls back to comparing the hash.
+    """
+    if not recorded or not os.path.exists(path):
+        return False
+    st = os.stat(path)
+    if st.st_size != recorded["size"]:
+        return False
+    if st.st_mtime_ns == recorded["mtime"]:
+        return True
+    return _sha1(path) == recorded["sha1"]
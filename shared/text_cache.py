@@ -0,0 +1,24 @@
+class TextCache:
+    """Rendered text surfaces keyed by (font, text, color, background).
+
+    A string is rasterized only the first time a combination is seen; once
+    max_size surfaces are kept the cache starts over.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.surfaces = {}
+
+    def render(self, font, text, color, background=None):
+        key = (font, text, color, background)
+        surf = self.surfaces.get(key)
+        if surf is None:
+            if len(self.surfaces) >= self.max_size:
+                self.surfaces.clear()
+            surf = font.render(text, True, color, background)
+            self.surfaces[key] = surf
+        return surf
+
+
+# One cache per game process
+text_cache = TextCache()